@@ -3,7 +3,7 @@ API 스키마 패키지
 Pydantic 모델들을 요청/응답/공통으로 분류하여 관리합니다.
 """
 
-from .common import BaseResponse, ErrorResponse
+from .common import BaseResponse, ErrorResponse, SourceDocument
 from .requests import QueryRequest
 from .responses import QueryResponse, HealthResponse, SystemStatusResponse
 
@@ -11,6 +11,7 @@ __all__ = [
     # Common
     "BaseResponse",
     "ErrorResponse",
+    "SourceDocument",
     # Requests
     "QueryRequest",
     # Responses
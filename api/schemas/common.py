@@ -3,13 +3,16 @@
 여러 API에서 공통으로 사용되는 데이터 모델을 정의합니다.
 """
 
-from typing import Optional, Any
-from pydantic import BaseModel, Field
+from typing import Optional, Any, Dict
+from typing_extensions import TypedDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BaseResponse(BaseModel):
     """기본 응답 모델"""
 
+    model_config = ConfigDict(defer_build=True)
+
     success: bool = Field(..., description="성공 여부")
     message: Optional[str] = Field(None, description="응답 메시지")
     data: Optional[Any] = Field(None, description="응답 데이터")
@@ -18,7 +21,21 @@ class BaseResponse(BaseModel):
 class ErrorResponse(BaseModel):
     """오류 응답 모델"""
 
+    model_config = ConfigDict(defer_build=True)
+
     success: bool = Field(default=False, description="성공 여부")
     error: str = Field(..., description="오류 메시지")
     error_code: Optional[str] = Field(None, description="오류 코드")
     details: Optional[Any] = Field(None, description="오류 상세 정보")
+
+
+class SourceDocument(TypedDict, total=False):
+    """참조 문서 (ResponseFormatter.format_sources 결과 형식)"""
+
+    id: int
+    source: str
+    content_preview: str
+    hybrid_score: float
+    bm25_score: float
+    vector_score: float
+    metadata: Dict[str, Any]
@@ -4,7 +4,7 @@ API 요청 스키마 정의
 """
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class QueryRequest(BaseModel):
@@ -14,10 +14,11 @@ class QueryRequest(BaseModel):
     user_id: Optional[str] = Field(None, description="사용자 ID")
     session_id: Optional[str] = Field(None, description="세션 ID (없으면 새 세션 생성)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {"query": "전세보증금을 돌려받지 못하고 있어요", "user_id": "user123", "session_id": "session456"}
         }
+    )
 
 
 class RebuildRequest(BaseModel):
@@ -25,5 +26,6 @@ class RebuildRequest(BaseModel):
 
     backup: bool = Field(default=True, description="기존 인덱스 백업 여부")
 
-    class Config:
-        json_schema_extra = {"example": {"backup": True}}
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"backup": True}}, defer_build=True
+    )
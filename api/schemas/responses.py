@@ -4,16 +4,50 @@ API 응답 스키마 정의
 """
 
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from typing_extensions import Annotated, TypedDict
 
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field
 
-class HealthResponse(BaseModel):
-    """헬스체크 응답 모델"""
+from .common import SourceDocument
 
-    status: str = Field(..., description="서버 상태")
-    message: Optional[str] = Field(None, description="상태 메시지")
-    timestamp: str = Field(..., description="응답 시간")
-    version: Optional[str] = Field(None, description="API 버전")
+
+class QueryClassification(TypedDict, total=False):
+    """질문 분류 결과"""
+
+    is_legal_related: bool
+    category: Optional[str]
+    confidence: float
+    reason: str
+    main_topic: str
+    key_entities: List[str]
+    is_follow_up: bool
+
+
+class ContextAnalysis(TypedDict, total=False):
+    """대화 맥락 분석 결과"""
+
+    is_follow_up: bool
+    is_topic_change: bool
+    context_score: float
+    suggested_category: Optional[str]
+
+
+class ConversationInfo(TypedDict, total=False):
+    """대화 정보"""
+
+    current_topic: str
+    legal_category: Optional[str]
+    message_count: int
+
+
+class HealthResponse(msgspec.Struct, frozen=True, kw_only=True):
+    """헬스체크 응답 모델 (검증 없이 직렬화만 하므로 msgspec 사용)"""
+
+    status: Annotated[str, msgspec.Meta(description="서버 상태")]
+    message: Annotated[Optional[str], msgspec.Meta(description="상태 메시지")] = None
+    timestamp: Annotated[str, msgspec.Meta(description="응답 시간")]
+    version: Annotated[Optional[str], msgspec.Meta(description="API 버전")] = None
 
 
 class SystemStatusResponse(BaseModel):
@@ -29,8 +63,10 @@ class SystemStatusResponse(BaseModel):
     # 대화 관리 통계 추가
     conversation_stats: Optional[Dict[str, Any]] = Field(None, description="대화 관리 통계")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "timestamp": "2024-01-01T12:00:00",
@@ -41,6 +77,7 @@ class SystemStatusResponse(BaseModel):
                 "conversation_stats": {"total_sessions": 10, "active_sessions": 5, "total_messages": 50},
             }
         }
+    )
 
 
 class QueryResponse(BaseModel):
@@ -57,15 +94,17 @@ class QueryResponse(BaseModel):
     session_id: str = Field(..., description="세션 ID")
 
     # 맥락 분석 정보 추가
-    context_analysis: Optional[Dict[str, Any]] = Field(None, description="맥락 분석 결과")
-    conversation_info: Optional[Dict[str, Any]] = Field(None, description="대화 정보")
+    context_analysis: Optional[ContextAnalysis] = Field(None, description="맥락 분석 결과")
+    conversation_info: Optional[ConversationInfo] = Field(None, description="대화 정보")
 
-    classification: Dict[str, Any] = Field(..., description="질문 분류 결과")
-    sources: List[Dict[str, Any]] = Field(default_factory=list, description="참조 문서")
+    classification: QueryClassification = Field(..., description="질문 분류 결과")
+    sources: List[SourceDocument] = Field(default_factory=list, description="참조 문서")
     error: Optional[str] = Field(None, description="오류 메시지")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        json_schema_extra={
             "example": {
                 "success": True,
                 "answer": "전세보증금 반환에 관한 법률적 조언입니다...",
@@ -81,27 +120,28 @@ class QueryResponse(BaseModel):
                     "suggested_category": "부동산",
                 },
                 "conversation_info": {"current_topic": "전세보증금", "legal_category": "부동산", "message_count": 1},
-                "classification": {"is_legal": True, "category": "부동산", "confidence": 0.9},
+                "classification": {"is_legal_related": True, "category": "부동산", "confidence": 0.9},
                 "sources": [],
             }
         }
+    )
 
 
-class RebuildResponse(BaseModel):
+class RebuildResponse(msgspec.Struct, frozen=True, kw_only=True):
     """인덱스 재구축 응답 모델"""
 
-    message: str = Field(..., description="응답 메시지")
-    status: str = Field(..., description="작업 상태")
-    task_id: Optional[str] = Field(None, description="백그라운드 작업 ID")
+    message: Annotated[str, msgspec.Meta(description="응답 메시지")]
+    status: Annotated[str, msgspec.Meta(description="작업 상태")]
+    task_id: Annotated[Optional[str], msgspec.Meta(description="백그라운드 작업 ID")] = None
 
 
-class ConfigResponse(BaseModel):
+class ConfigResponse(msgspec.Struct, frozen=True, kw_only=True):
     """설정 정보 응답 모델 (디버그용)"""
 
-    debug_mode: bool = Field(..., description="디버그 모드")
-    environment: str = Field(..., description="실행 환경")
-    app_version: str = Field(..., description="앱 버전")
-    chunk_size: int = Field(..., description="청크 크기")
-    top_k: int = Field(..., description="상위 K개 문서")
-    vector_db_path: str = Field(..., description="벡터 DB 경로")
-    search_weights: Dict[str, float] = Field(..., description="검색 가중치")
+    debug_mode: Annotated[bool, msgspec.Meta(description="디버그 모드")]
+    environment: Annotated[str, msgspec.Meta(description="실행 환경")]
+    app_version: Annotated[str, msgspec.Meta(description="앱 버전")]
+    chunk_size: Annotated[int, msgspec.Meta(description="청크 크기")]
+    top_k: Annotated[int, msgspec.Meta(description="상위 K개 문서")]
+    vector_db_path: Annotated[str, msgspec.Meta(description="벡터 DB 경로")]
+    search_weights: Annotated[Dict[str, float], msgspec.Meta(description="검색 가중치")]
@@ -3,12 +3,22 @@
 시스템 관리 및 유지보수 관련 API를 제공합니다.
 """
 
+import asyncio
 import os
-from fastapi import APIRouter, Depends, BackgroundTasks
+import secrets
+import shutil
+import stat
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+import msgspec
+import orjson
+from fastapi import APIRouter, Depends, BackgroundTasks, Response
+from fastapi.responses import ORJSONResponse
 
 from core.config import get_settings
 from core.logging.config import get_logger
-from core.dependencies import get_rag_orchestrator
+from core.dependencies import get_rag_orchestrator, json_body, json_body_openapi, struct_response_openapi
 from api.schemas.requests import RebuildRequest
 from api.schemas.responses import RebuildResponse, ConfigResponse
 from services.rag.orchestrator import RAGOrchestrator
@@ -16,14 +26,21 @@ from app.utils import get_directory_size
 from app.tasks import rebuild_task, create_backup
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = get_logger(__name__)
 
+# 백업별 정보 캐시 (이름 -> (디렉토리 mtime, 백업 정보))
+_BACKUP_META_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
 
-@router.post("/rebuild-indexes", response_model=RebuildResponse)
+@router.post(
+    "/rebuild-indexes",
+    responses=struct_response_openapi(RebuildResponse),
+    openapi_extra=json_body_openapi(RebuildRequest),
+)
 async def rebuild_indexes(
-    request: RebuildRequest,
     background_tasks: BackgroundTasks,
+    request: RebuildRequest = Depends(json_body(RebuildRequest)),
     rag_orchestrator: RAGOrchestrator = Depends(get_rag_orchestrator),
 ):
     """
@@ -38,27 +55,24 @@ async def rebuild_indexes(
 
         logger.info("📝 인덱스 재구축 백그라운드 작업 시작")
 
-        return RebuildResponse(
-            message="인덱스 재구축 작업이 백그라운드에서 시작되었습니다.", status="started", task_id=f"rebuild_{int(os.urandom(4).hex(), 16)}"
+        response = RebuildResponse(
+            message="인덱스 재구축 작업이 백그라운드에서 시작되었습니다.", status="started", task_id=f"rebuild_{secrets.token_hex(4)}"
         )
 
     except Exception as e:
         logger.error(f"❌ 인덱스 재구축 요청 실패: {str(e)}")
-        return RebuildResponse(message=f"인덱스 재구축 요청 실패: {str(e)}", status="failed")
+        response = RebuildResponse(message=f"인덱스 재구축 요청 실패: {str(e)}", status="failed")
 
+    return Response(content=msgspec.json.encode(response), media_type="application/json")
 
-@router.get("/config", response_model=ConfigResponse)
-async def get_config():
-    """
-    설정 정보 조회 (디버그용)
-    현재 시스템 설정을 반환합니다.
-    """
-    logger.debug("⚙️ 설정 정보 조회 요청")
 
+@lru_cache(maxsize=1)
+def _encoded_config_response() -> bytes:
+    """설정 정보 응답 (프로세스 수명 동안 설정이 바뀌지 않으므로 한 번만 생성)"""
     settings = get_settings()
 
-    return ConfigResponse(
-        debug_mode=getattr(settings, "DEBUG", False),
+    response = ConfigResponse(
+        debug_mode=settings.DEBUG,
         environment=os.getenv("ENVIRONMENT", "development"),
         app_version=settings.APP_VERSION,
         chunk_size=settings.CHUNK_SIZE,
@@ -66,6 +80,73 @@ async def get_config():
         vector_db_path=settings.VECTOR_DB_PATH,
         search_weights={"bm25": settings.BM25_WEIGHT, "vector": settings.VECTOR_WEIGHT},
     )
+    return msgspec.json.encode(response)
+
+
+@router.get("/config", responses=struct_response_openapi(ConfigResponse))
+async def get_config():
+    """
+    설정 정보 조회 (디버그용)
+    현재 시스템 설정을 반환합니다.
+    """
+    logger.debug("⚙️ 설정 정보 조회 요청")
+
+    return Response(content=_encoded_config_response(), media_type="application/json")
+
+
+def _read_backup_info(backup_name: str, backup_path: str) -> Dict[str, Any]:
+    """백업 메타데이터를 읽어 백업 정보 구성"""
+    metadata_path = os.path.join(backup_path, "backup_metadata.json")
+    metadata = {}
+
+    # 존재 여부를 미리 확인하지 않고 바로 열기 (메타데이터 없으면 무시)
+    try:
+        with open(metadata_path, "rb") as f:
+            metadata = orjson.loads(f.read())
+    except Exception:
+        pass
+
+    size_bytes = metadata.get("backup_size")
+    if size_bytes is None:
+        size_bytes = get_directory_size(backup_path)
+
+    return {
+        "name": backup_name,
+        "path": backup_path,
+        "created_at": metadata.get("created_at", "알 수 없음"),
+        "size_bytes": size_bytes,
+        "files_count": len(metadata.get("files_backed_up", [])),
+        "files": metadata.get("files_backed_up", []),
+    }
+
+
+def _scan_backups(backup_dir: str) -> List[Dict[str, Any]]:
+    """백업 디렉토리 스캔 (변경되지 않은 백업은 캐시된 정보 재사용)"""
+    backups = []
+    seen = set()
+
+    with os.scandir(backup_dir) as it:
+        for entry in it:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+
+            seen.add(entry.name)
+            mtime = entry.stat().st_mtime
+            cached = _BACKUP_META_CACHE.get(entry.name)
+
+            if cached is not None and cached[0] == mtime:
+                backup_info = cached[1]
+            else:
+                backup_info = _read_backup_info(entry.name, entry.path)
+                _BACKUP_META_CACHE[entry.name] = (mtime, backup_info)
+
+            backups.append(dict(backup_info))
+
+    # 삭제된 백업 캐시 정리
+    for name in _BACKUP_META_CACHE.keys() - seen:
+        _BACKUP_META_CACHE.pop(name, None)
+
+    return backups
 
 
 @router.get("/backups")
@@ -75,38 +156,11 @@ async def list_backups():
         logger.debug("📋 백업 목록 조회")
 
         backup_dir = "backups"
-        if not os.path.exists(backup_dir):
+        try:
+            backups = await asyncio.to_thread(_scan_backups, backup_dir)
+        except FileNotFoundError:
             return {"success": True, "backups": [], "total_backups": 0, "message": "백업 디렉토리가 없습니다"}
 
-        backups = []
-        for backup_name in os.listdir(backup_dir):
-            backup_path = os.path.join(backup_dir, backup_name)
-            if os.path.isdir(backup_path):
-                # 백업 메타데이터 읽기
-                metadata_path = os.path.join(backup_path, "backup_metadata.json")
-                metadata = {}
-
-                if os.path.exists(metadata_path):
-                    try:
-                        with open(metadata_path, "r", encoding="utf-8") as f:
-                            import json
-
-                            metadata = json.load(f)
-                    except Exception:
-                        pass
-
-                # 백업 정보 수집
-                backup_info = {
-                    "name": backup_name,
-                    "path": backup_path,
-                    "created_at": metadata.get("created_at", "알 수 없음"),
-                    "size_bytes": metadata.get("backup_size", get_directory_size(backup_path)),
-                    "files_count": len(metadata.get("files_backed_up", [])),
-                    "files": metadata.get("files_backed_up", []),
-                }
-
-                backups.append(backup_info)
-
         # 생성 시간 순으로 정렬 (최신 순)
         backups.sort(key=lambda x: x["created_at"], reverse=True)
 
@@ -143,16 +197,17 @@ async def delete_backup(backup_name: str):
 
         backup_path = os.path.join("backups", backup_name)
 
-        if not os.path.exists(backup_path):
+        # 존재 여부와 디렉토리 여부를 한 번의 stat으로 확인
+        try:
+            backup_stat = os.stat(backup_path)
+        except FileNotFoundError:
             return {"success": False, "message": "백업을 찾을 수 없습니다"}
 
-        if not os.path.isdir(backup_path):
+        if not stat.S_ISDIR(backup_stat.st_mode):
             return {"success": False, "message": "유효하지 않은 백업 디렉토리입니다"}
 
-        # 백업 디렉토리 삭제
-        import shutil
-
-        shutil.rmtree(backup_path)
+        # 백업 디렉토리 삭제 (이벤트 루프 블로킹 방지)
+        await asyncio.to_thread(shutil.rmtree, backup_path)
 
         logger.info(f"✅ 백업 삭제 완료: {backup_name}")
 
@@ -184,14 +239,14 @@ async def restore_backup(backup_name: str):
         # 벡터 DB 복원
         backup_vector_path = os.path.join(backup_path, "vector_db")
         if os.path.exists(backup_vector_path):
-            import shutil
-
             # 기존 벡터 DB 삭제
-            if os.path.exists(settings.VECTOR_DB_PATH):
-                shutil.rmtree(settings.VECTOR_DB_PATH)
+            try:
+                await asyncio.to_thread(shutil.rmtree, settings.VECTOR_DB_PATH)
+            except FileNotFoundError:
+                pass
 
-            # 백업에서 복원
-            shutil.copytree(backup_vector_path, settings.VECTOR_DB_PATH)
+            # 백업에서 복원 (복사본 사용: 하드링크는 DB 쓰기 시 백업까지 변경됨)
+            await asyncio.to_thread(shutil.copytree, backup_vector_path, settings.VECTOR_DB_PATH)
             logger.info(f"✅ 벡터 DB 복원 완료: {settings.VECTOR_DB_PATH}")
 
         logger.info(f"✅ 백업 복원 완료: {backup_name}")
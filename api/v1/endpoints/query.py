@@ -4,21 +4,135 @@
 대화 맥락을 인식하고 연속적인 대화를 지원합니다.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 
 from core.logging.config import get_logger
-from core.dependencies import get_rag_orchestrator
+from core.dependencies import get_rag_orchestrator, json_body, json_body_openapi
 from api.schemas.requests import QueryRequest
 from api.schemas.responses import QueryResponse
 from services.rag.orchestrator import RAGOrchestrator
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = get_logger(__name__)
 
+# 응답 직렬화기 (모듈 로드 시 한 번만 생성)
+_QUERY_RESP_TA = TypeAdapter(QueryResponse)
+
+
+def _compile_constructor(model_cls):
+    """
+    고정 필드 모델용 생성 함수를 모듈 로드 시 컴파일
+    필드 순서대로 위치 인자를 받아 검증 없이 인스턴스 상태를 직접 채웁니다.
+    """
+    names = list(model_cls.model_fields)
+    args = ", ".join(names)
+    items = ", ".join(f"{name!r}: {name}" for name in names)
+    source = (
+        f"def build({args}):\n"
+        f"    obj = _new(_cls)\n"
+        f"    _setattr(obj, '__dict__', {{{items}}})\n"
+        f"    _setattr(obj, '__pydantic_fields_set__', set(_names))\n"
+        f"    _setattr(obj, '__pydantic_extra__', None)\n"
+        f"    _setattr(obj, '__pydantic_private__', None)\n"
+        f"    return obj\n"
+    )
+    namespace = {"_new": object.__new__, "_setattr": object.__setattr__, "_cls": model_cls, "_names": tuple(names)}
+    exec(compile(source, f"<{model_cls.__name__} constructor>", "exec"), namespace)
+    return namespace["build"]
+
+
+# 오케스트레이터가 생성한 신뢰 가능한 데이터이므로 검증 없이 구성
+_build_query_response = _compile_constructor(QueryResponse)
+
+
+def _encode_query_response(response: QueryResponse) -> bytes:
+    """
+    QueryResponse JSON 인코딩
+    필드 값이 이미 JSON 호환 dict/list이므로 인스턴스 __dict__를 orjson으로 바로 인코딩하고,
+    인코딩할 수 없는 값이 섞인 경우에만 pydantic 직렬화기를 사용합니다.
+    """
+    try:
+        return orjson.dumps(response.__dict__, option=orjson.OPT_SERIALIZE_NUMPY)
+    except TypeError:
+        return _QUERY_RESP_TA.dump_json(response)
+
+
+# 동일 세션의 반복 질문 결과 캐시 ((세션 ID, 질문) -> (저장 시각, 응답))
+_QUERY_CACHE_TTL = 60.0
+_QUERY_CACHE_MAX_SIZE = 1000
+_QUERY_CACHE: "OrderedDict[Tuple[str, str], Tuple[float, QueryResponse]]" = OrderedDict()
+
+
+def _get_cached_response(key: Tuple[str, str]) -> Optional[QueryResponse]:
+    """TTL 이내의 캐시된 응답 조회"""
+    cached = _QUERY_CACHE.get(key)
+    if cached is None:
+        return None
+
+    stored_at, response = cached
+    if time.monotonic() - stored_at > _QUERY_CACHE_TTL:
+        del _QUERY_CACHE[key]
+        return None
+
+    _QUERY_CACHE.move_to_end(key)
+    return response.model_copy(update={"processing_time": 0.0})
+
 
-@router.post("", response_model=QueryResponse)
-async def process_query(request: QueryRequest, rag_orchestrator: RAGOrchestrator = Depends(get_rag_orchestrator)):
+def _store_cached_response(key: Tuple[str, str], response: QueryResponse) -> None:
+    """응답을 캐시에 저장 (최대 크기 초과 시 가장 오래된 항목 제거)"""
+    _QUERY_CACHE[key] = (time.monotonic(), response)
+    _QUERY_CACHE.move_to_end(key)
+    while len(_QUERY_CACHE) > _QUERY_CACHE_MAX_SIZE:
+        _QUERY_CACHE.popitem(last=False)
+
+
+def _finalize_query_response(result: dict, cache_key: Optional[Tuple[str, str]]) -> QueryResponse:
+    """RAG 결과를 API 응답 형식으로 변환하고 성공한 응답은 캐시에 저장"""
+    # QueryResponse 필드 순서
+    success = result.get("success", True)
+    response = _build_query_response(
+        success,
+        result.get("answer", "답변을 생성할 수 없습니다."),
+        result.get("confidence", 0.0),
+        result.get("processing_time", 0.0),
+        result.get("search_method", "하이브리드 검색"),
+        result.get("retrieved_docs_count", 0),
+        result.get("session_id", ""),
+        result.get("context_analysis"),
+        result.get("conversation_info"),
+        result.get("classification", {}),
+        result.get("sources", []),
+        result.get("error", None) if not success else None,
+    )
+
+    if response.success:
+        if cache_key is not None:
+            _store_cached_response(cache_key, response)
+        logger.info(f"✅ 질문 처리 완료: {response.processing_time:.2f}초 (세션: {response.session_id})")
+    else:
+        logger.warning(f"⚠️ 질문 처리 실패: {response.error}")
+
+    return response
+
+
+def _encode_stream_result(response: QueryResponse) -> bytes:
+    """스트리밍 마지막 줄 (최종 응답) 인코딩"""
+    return b'{"type":"result","data":' + _encode_query_response(response) + b"}\n"
+
+
+@router.post("", responses={200: {"model": QueryResponse}}, openapi_extra=json_body_openapi(QueryRequest))
+async def process_query(
+    request: QueryRequest = Depends(json_body(QueryRequest)),
+    rag_orchestrator: RAGOrchestrator = Depends(get_rag_orchestrator),
+):
     """
     질문 처리 (대화 맥락 지원)
     사용자의 법률 질문을 처리하여 AI 답변을 생성합니다.
@@ -26,35 +140,57 @@ async def process_query(request: QueryRequest, rag_orchestrator: RAGOrchestrator
     """
     logger.info(f"📝 질문 처리 요청: '{request.query}' (사용자: {request.user_id}, 세션: {request.session_id})")
 
+    # 같은 세션에서 같은 질문이 반복되면 캐시된 응답 반환
+    cache_key = (request.session_id, request.query) if request.session_id else None
+    if cache_key is not None:
+        cached_response = _get_cached_response(cache_key)
+        if cached_response is not None:
+            logger.info(f"⚡ 캐시된 응답 반환 (세션: {request.session_id})")
+            return Response(content=_encode_query_response(cached_response), media_type="application/json")
+
     try:
         # RAG 시스템을 통한 질문 처리 (대화 맥락 지원)
         result = await rag_orchestrator.process_query(
             user_query=request.query, user_id=request.user_id, session_id=request.session_id
         )
 
-        # RAG 결과를 API 응답 형식으로 변환
-        response = QueryResponse(
-            success=result.get("success", True),
-            answer=result.get("answer", "답변을 생성할 수 없습니다."),
-            confidence=result.get("confidence", 0.0),
-            processing_time=result.get("processing_time", 0.0),
-            search_method=result.get("search_method", "하이브리드 검색"),
-            retrieved_docs_count=result.get("retrieved_docs_count", 0),
-            session_id=result.get("session_id", ""),
-            context_analysis=result.get("context_analysis"),
-            conversation_info=result.get("conversation_info"),
-            classification=result.get("classification", {}),
-            sources=result.get("sources", []),
-            error=result.get("error", None) if not result.get("success", True) else None,
-        )
+        response = _finalize_query_response(result, cache_key)
 
-        if response.success:
-            logger.info(f"✅ 질문 처리 완료: {response.processing_time:.2f}초 (세션: {response.session_id})")
-        else:
-            logger.warning(f"⚠️ 질문 처리 실패: {response.error}")
-
-        return response
+        # response_model 재검증을 거치지 않고 직렬화된 JSON을 바로 반환
+        return Response(content=_encode_query_response(response), media_type="application/json")
 
     except Exception as e:
         logger.error(f"❌ 질문 처리 오류: {str(e)}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"질문 처리 중 오류가 발생했습니다: {str(e)}")
+
+
+@router.post("/stream", openapi_extra=json_body_openapi(QueryRequest))
+async def process_query_stream(
+    request: QueryRequest = Depends(json_body(QueryRequest)),
+    rag_orchestrator: RAGOrchestrator = Depends(get_rag_orchestrator),
+):
+    """
+    질문 처리 (답변 스트리밍)
+    답변 조각을 생성되는 대로 NDJSON({"type": "token", "content": ...})으로 전송하고,
+    마지막 줄({"type": "result", "data": ...})에 일반 질문 처리와 같은 형식의 최종 응답을 보냅니다.
+    """
+    logger.info(f"📝 스트리밍 질문 처리 요청: '{request.query}' (사용자: {request.user_id}, 세션: {request.session_id})")
+
+    # 같은 세션에서 같은 질문이 반복되면 캐시된 응답만 전송
+    cache_key = (request.session_id, request.query) if request.session_id else None
+    if cache_key is not None:
+        cached_response = _get_cached_response(cache_key)
+        if cached_response is not None:
+            logger.info(f"⚡ 캐시된 응답 반환 (세션: {request.session_id})")
+            return Response(content=_encode_stream_result(cached_response), media_type="application/x-ndjson")
+
+    async def event_stream():
+        async for event in rag_orchestrator.process_query_stream(
+            user_query=request.query, user_id=request.user_id, session_id=request.session_id
+        ):
+            if event["type"] == "token":
+                yield orjson.dumps(event) + b"\n"
+            else:
+                yield _encode_stream_result(_finalize_query_response(event, cache_key))
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
@@ -3,10 +3,19 @@
 FastAPI 애플리케이션의 의존성과 앱 팩토리를 정의합니다.
 """
 
+import asyncio
+import logging
+import os
 import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional
+from typing import IO, AsyncGenerator, Optional
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -14,39 +23,107 @@ from apscheduler.triggers.cron import CronTrigger
 
 from core.config import get_settings
 from core.logging.config import get_logger
-from core.dependencies import set_rag_orchestrator
+from services.document.processor import shutdown_process_pool
 from services.rag.orchestrator import RAGOrchestrator
 
 logger = get_logger(__name__)
 
-# 전역 변수
-rag_orchestrator: Optional[RAGOrchestrator] = None
-scheduler: Optional[AsyncIOScheduler] = None
+# 스케줄러 트리거 (모듈 로드 시 한 번만 파싱)
+_HEALTH_TRIGGER = CronTrigger(minute="*/5")  # 매 5분
+_REBUILD_TRIGGER = CronTrigger(hour=2, minute=0)  # 매일 새벽 2시
+
+# 외부 API(LLM 등) 호출용 공유 HTTP 클라이언트 설정
+HTTP_CLIENT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+HTTP_CLIENT_TIMEOUT = httpx.Timeout(30.0)
+
+# 멀티 워커 환경에서 스케줄러를 하나의 워커만 실행하기 위한 잠금 파일
+SCHEDULER_LOCK_FILE = os.path.join("logs", ".scheduler.lock")
+
+
+def _acquire_scheduler_lock() -> Optional[IO]:
+    """
+    스케줄러 잠금 획득 (비블로킹)
+    이미 다른 워커가 잠금을 보유하고 있으면 None을 반환합니다.
+    fcntl을 사용할 수 없는 환경에서는 잠금 없이 실행을 허용합니다.
+    """
+    os.makedirs(os.path.dirname(SCHEDULER_LOCK_FILE), exist_ok=True)
+    lock_file = open(SCHEDULER_LOCK_FILE, "a")
+
+    if fcntl is None:
+        return lock_file
+
+    try:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+
+    return lock_file
+
+
+def _release_scheduler_lock(lock_file: IO) -> None:
+    """스케줄러 잠금 해제"""
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    finally:
+        lock_file.close()
+
+
+async def _create_rag_orchestrator(http_client: httpx.AsyncClient) -> RAGOrchestrator:
+    """RAG 오케스트레이터 생성 및 초기화 (모델 로딩은 워커 스레드에서 실행)"""
+    rag_orchestrator = await asyncio.to_thread(RAGOrchestrator, http_client=http_client)
+    await rag_orchestrator.initialize()
+    return rag_orchestrator
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """FastAPI 앱 라이프사이클 관리"""
-    global rag_orchestrator, scheduler
     settings = get_settings()
+    rag_orchestrator: Optional[RAGOrchestrator] = None
+    scheduler: Optional[AsyncIOScheduler] = None
+    scheduler_lock: Optional[IO] = None
+    init_task: Optional[asyncio.Task] = None
+
+    # 공유 HTTP 클라이언트 (커넥션 풀/HTTP2 재사용)
+    http_client = httpx.AsyncClient(http2=True, limits=HTTP_CLIENT_LIMITS, timeout=HTTP_CLIENT_TIMEOUT)
+    app.state.http_client = http_client
 
     try:
-        # RAG 시스템 초기화
+        # RAG 시스템 초기화 (임베딩 모델 로딩은 백그라운드에서 진행)
         logger.info("🚀 RAG 시스템 초기화 중...")
-        rag_orchestrator = RAGOrchestrator()
-        await rag_orchestrator.initialize()
-        set_rag_orchestrator(rag_orchestrator)
+        init_task = asyncio.create_task(_create_rag_orchestrator(http_client))
 
-        # 스케줄러 초기화 (운영 환경에서만)
-        if not getattr(settings, "DEBUG", False):
+        # 모델 로딩과 병행하여 스케줄러 준비 (운영 환경에서만, 잠금을 획득한 워커 하나만)
+        if not settings.DEBUG:
+            scheduler_lock = _acquire_scheduler_lock()
+            if scheduler_lock is None:
+                logger.info("⏰ 다른 워커가 스케줄러를 실행 중이므로 스케줄러 시작 스킵")
+
+        if scheduler_lock is not None:
             scheduler = AsyncIOScheduler()
 
+        rag_orchestrator = await init_task
+        app.state.rag_orchestrator = rag_orchestrator
+
+        if scheduler is not None:
             # 헬스체크 작업 (매 5분)
-            scheduler.add_job(health_check_job, CronTrigger(minute="*/5"), id="health_check", name="정기 헬스체크")
+            scheduler.add_job(
+                health_check_job,
+                _HEALTH_TRIGGER,
+                args=[rag_orchestrator],
+                id="health_check",
+                name="정기 헬스체크",
+            )
 
             # 인덱스 재구축 작업 (매일 새벽 2시)
             scheduler.add_job(
-                scheduled_rebuild_job, CronTrigger(hour=2, minute=0), id="rebuild_indexes", name="인덱스 재구축"
+                scheduled_rebuild_job,
+                _REBUILD_TRIGGER,
+                args=[rag_orchestrator],
+                id="rebuild_indexes",
+                name="인덱스 재구축",
             )
 
             scheduler.start()
@@ -60,25 +137,36 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         raise
     finally:
         # 정리 작업
-        if scheduler:
+        if init_task is not None and not init_task.done():
+            init_task.cancel()
+
+        if scheduler and scheduler.running:
             scheduler.shutdown()
             logger.info("⏰ 스케줄러 종료 완료")
 
+        if scheduler_lock:
+            _release_scheduler_lock(scheduler_lock)
+
         if rag_orchestrator:
             await rag_orchestrator.cleanup()
             logger.info("🧹 RAG 시스템 정리 완료")
 
+        shutdown_process_pool()
+
+        await http_client.aclose()
+
 
 def create_app() -> FastAPI:
     """FastAPI 앱 생성 및 설정"""
     settings = get_settings()
+    debug = settings.DEBUG
 
     app = FastAPI(
         title=settings.APP_NAME,
         description=settings.APP_DESCRIPTION,
         version=settings.APP_VERSION,
         lifespan=lifespan,
-        debug=getattr(settings, "DEBUG", False),
+        debug=debug,
     )
 
     # CORS 설정
@@ -96,21 +184,24 @@ def create_app() -> FastAPI:
     app.include_router(api_router, prefix="/api/v1")
 
     # 디버그 미들웨어 (개발 환경에서만)
-    if getattr(settings, "DEBUG", False):
+    if debug:
 
         @app.middleware("http")
         async def debug_middleware(request, call_next):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             response = await call_next(request)
-            process_time = time.time() - start_time
-            logger.debug(f"🔍 {request.method} {request.url} - {response.status_code} ({process_time:.3f}s)")
+            if logger.isEnabledFor(logging.DEBUG):
+                process_ns = time.perf_counter_ns() - start_ns
+                logger.debug(
+                    "🔍 %s %s - %d (%.2fms)", request.method, request.url, response.status_code, process_ns / 1e6
+                )
             return response
 
     logger.info("⚙️ FastAPI 앱 생성 완료")
     return app
 
 
-def health_check_job():
+def health_check_job(rag_orchestrator: Optional[RAGOrchestrator]):
     """스케줄러용 헬스체크 작업"""
     try:
         if rag_orchestrator:
@@ -122,15 +213,13 @@ def health_check_job():
         logger.error(f"❌ 정기 헬스체크 실패: {str(e)}")
 
 
-def scheduled_rebuild_job():
-    """스케줄러용 인덱스 재구축 작업"""
+async def scheduled_rebuild_job(rag_orchestrator: Optional[RAGOrchestrator]):
+    """스케줄러용 인덱스 재구축 작업 (AsyncIOScheduler가 이벤트 루프에서 직접 실행)"""
     try:
         logger.info("🔄 스케줄된 인덱스 재구축 시작")
         if rag_orchestrator:
-            import asyncio
-
-            asyncio.create_task(rag_orchestrator.rebuild_indexes())
-            logger.info("✅ 스케줄된 인덱스 재구축 작업 시작")
+            await rag_orchestrator.rebuild_indexes()
+            logger.info("✅ 스케줄된 인덱스 재구축 완료")
         else:
             logger.warning("⚠️ RAG 시스템이 초기화되지 않아 재구축 스킵")
     except Exception as e:
@@ -2,6 +2,8 @@
 Law Mate FastAPI 애플리케이션 진입점
 """
 
+import sys
+
 import uvicorn
 from core.config import get_settings
 from core.logging.config import setup_logging, get_logger
@@ -31,4 +33,7 @@ if __name__ == "__main__":
         port=settings.API_PORT,
         reload=settings.DEBUG,
         log_level=settings.LOG_LEVEL.lower(),
+        # uvloop/httptools는 Windows 미지원
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
@@ -1,16 +1,52 @@
 """
 백그라운드 작업 함수들
 """
+import asyncio
 import os
+import shutil
+from datetime import datetime
+
+import orjson
+
 from services.rag.orchestrator import RAGOrchestrator
 from core.logging.config import get_logger
 from core.config import get_settings
-from app.utils import get_directory_size
 
 
 logger = get_logger(__name__)
 
 
+class _SizeTrackingCopier:
+    """
+    백업용 파일 복사 함수 (shutil.copytree의 copy_function으로 사용)
+    os.sendfile로 커널 내에서 복사하고, 복사한 바이트 수를 누적하여
+    백업 후 디렉토리를 다시 순회하지 않고 백업 크기를 구합니다.
+    """
+
+    def __init__(self):
+        self.total_bytes = 0
+
+    def __call__(self, src: str, dst: str) -> str:
+        if os.path.isdir(dst):
+            dst = os.path.join(dst, os.path.basename(src))
+
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            size = os.fstat(fsrc.fileno()).st_size
+            if hasattr(os, "sendfile"):
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            else:
+                shutil.copyfileobj(fsrc, fdst)
+
+        shutil.copystat(src, dst)
+        self.total_bytes += size
+        return dst
+
+
 async def rebuild_task(rag_orchestrator: RAGOrchestrator, backup: bool) -> None:
     """백그라운드 인덱스 재구축 작업"""
     try:
@@ -35,55 +71,59 @@ async def rebuild_task(rag_orchestrator: RAGOrchestrator, backup: bool) -> None:
         logger.error(f"❌ 백그라운드 인덱스 재구축 오류: {str(e)}")
 
 
+def _create_backup_sync() -> str:
+    """백업 생성 (동기 I/O, 워커 스레드에서 실행)"""
+    settings = get_settings()
+
+    # 백업 디렉토리 생성
+    backup_dir = os.path.join("backups", datetime.now().strftime("%Y%m%d_%H%M%S"))
+    os.makedirs(backup_dir, exist_ok=True)
+
+    logger.info(f"📦 백업 생성 중: {backup_dir}")
+
+    copier = _SizeTrackingCopier()
+
+    # 벡터 DB 백업
+    vector_db_path = settings.VECTOR_DB_PATH
+    if os.path.exists(vector_db_path):
+        backup_vector_path = os.path.join(backup_dir, "vector_db")
+        shutil.copytree(vector_db_path, backup_vector_path, copy_function=copier)
+        logger.debug(f"✅ 벡터 DB 백업 완료: {backup_vector_path}")
+
+    # 로그 파일 백업 (선택사항)
+    log_file = settings.LOG_FILE
+    if log_file and os.path.exists(log_file):
+        backup_log_path = os.path.join(backup_dir, os.path.basename(log_file))
+        copier(log_file, backup_log_path)
+        logger.debug(f"✅ 로그 파일 백업 완료: {backup_log_path}")
+
+    # 설정 파일 백업
+    config_files = [".env", ".env.dev", ".env.prod"]
+    for config_file in config_files:
+        if os.path.exists(config_file):
+            backup_config_path = os.path.join(backup_dir, config_file)
+            copier(config_file, backup_config_path)
+            logger.debug(f"✅ 설정 파일 백업 완료: {backup_config_path}")
+
+    # 백업 메타데이터 생성
+    backup_metadata = {
+        "created_at": datetime.now().isoformat(),
+        "vector_db_path": vector_db_path,
+        "backup_size": copier.total_bytes,
+        "files_backed_up": os.listdir(backup_dir),
+    }
+
+    metadata_path = os.path.join(backup_dir, "backup_metadata.json")
+    with open(metadata_path, "wb") as f:
+        f.write(orjson.dumps(backup_metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+    return backup_dir
+
+
 async def create_backup() -> bool:
-    """벡터 DB 및 인덱스 백업"""
+    """벡터 DB 및 인덱스 백업 (파일 복사는 이벤트 루프 밖에서 수행)"""
     try:
-        import shutil
-        from datetime import datetime
-
-        settings = get_settings()
-
-        # 백업 디렉토리 생성
-        backup_dir = os.path.join("backups", datetime.now().strftime("%Y%m%d_%H%M%S"))
-        os.makedirs(backup_dir, exist_ok=True)
-
-        logger.info(f"📦 백업 생성 중: {backup_dir}")
-
-        # 벡터 DB 백업
-        vector_db_path = settings.VECTOR_DB_PATH
-        if os.path.exists(vector_db_path):
-            backup_vector_path = os.path.join(backup_dir, "vector_db")
-            shutil.copytree(vector_db_path, backup_vector_path)
-            logger.debug(f"✅ 벡터 DB 백업 완료: {backup_vector_path}")
-
-        # 로그 파일 백업 (선택사항)
-        log_file = settings.LOG_FILE
-        if log_file and os.path.exists(log_file):
-            backup_log_path = os.path.join(backup_dir, os.path.basename(log_file))
-            shutil.copy2(log_file, backup_log_path)
-            logger.debug(f"✅ 로그 파일 백업 완료: {backup_log_path}")
-
-        # 설정 파일 백업
-        config_files = [".env", ".env.dev", ".env.prod"]
-        for config_file in config_files:
-            if os.path.exists(config_file):
-                backup_config_path = os.path.join(backup_dir, config_file)
-                shutil.copy2(config_file, backup_config_path)
-                logger.debug(f"✅ 설정 파일 백업 완료: {backup_config_path}")
-
-        # 백업 메타데이터 생성
-        backup_metadata = {
-            "created_at": datetime.now().isoformat(),
-            "vector_db_path": vector_db_path,
-            "backup_size": get_directory_size(backup_dir),
-            "files_backed_up": os.listdir(backup_dir),
-        }
-
-        metadata_path = os.path.join(backup_dir, "backup_metadata.json")
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            import json
-
-            json.dump(backup_metadata, f, indent=2, ensure_ascii=False)
+        backup_dir = await asyncio.to_thread(_create_backup_sync)
 
         logger.info(f"✅ 백업 생성 완료: {backup_dir}")
         return True
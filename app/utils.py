@@ -1,15 +1,61 @@
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+
+# 디렉토리 크기 계산 시 병렬 탐색 스레드 수
+DIRECTORY_SIZE_MAX_WORKERS = 8
+
+# 초 단위 타임스탬프 접두사 캐시 (초, "YYYY-MM-DDTHH:MM:SS")
+_TIMESTAMP_PREFIX: Tuple[int, str] = (-1, "")
+
+
+def _scan_directory_size(directory: str) -> int:
+    """os.scandir 기반 디렉토리 크기 합산 (DirEntry에 캐시된 stat 정보 사용)"""
+    total_size = 0
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total_size += entry.stat(follow_symlinks=False).st_size
+    return total_size
 
 
 def get_directory_size(directory: str) -> int:
-    """디렉토리 크기 계산"""
+    """디렉토리 크기 계산 (최상위 하위 디렉토리는 스레드 풀에서 병렬 탐색)"""
     try:
         total_size = 0
-        for dirpath, dirnames, filenames in os.walk(directory):
-            for filename in filenames:
-                file_path = os.path.join(dirpath, filename)
-                if os.path.exists(file_path):
-                    total_size += os.path.getsize(file_path)
+        subdirs = []
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total_size += entry.stat(follow_symlinks=False).st_size
+
+        if len(subdirs) > 1:
+            with ThreadPoolExecutor(max_workers=min(DIRECTORY_SIZE_MAX_WORKERS, len(subdirs))) as executor:
+                total_size += sum(executor.map(_scan_directory_size, subdirs))
+        elif subdirs:
+            total_size += _scan_directory_size(subdirs[0])
+
         return total_size
     except Exception:
         return 0
+
+
+def iso_timestamp() -> str:
+    """현재 로컬 시각의 ISO-8601 문자열 (datetime.now().isoformat() 대체)"""
+    global _TIMESTAMP_PREFIX
+
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _TIMESTAMP_PREFIX
+    if cached_second != second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _TIMESTAMP_PREFIX = (second, prefix)
+
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}"
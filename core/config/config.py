@@ -3,11 +3,19 @@ Law Mate 설정 관리
 환경별 설정을 하나의 파일에서 관리합니다.
 """
 
+import logging
 import os
-from functools import lru_cache
-from typing import List
+from functools import cached_property, lru_cache
+from typing import Any, List
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# core.logging은 설정을 import하므로 표준 logging으로 직접 로거 생성 (순환 import 방지)
+logger = logging.getLogger(__name__)
+
+# .env 파일 로드 여부 (프로세스당 한 번만 로드)
+_ENV_LOADED = False
+
 
 def get_env_file() -> str:
     """환경에 따른 .env 파일 경로 결정"""
@@ -19,10 +27,31 @@ def get_env_file() -> str:
     env = os.getenv("ENVIRONMENT", "development").lower()
     env_files = {"development": ".env.dev", "production": ".env.prod", "test": ".env.test"}
     selected_file = env_files.get(env, ".env")
-    print(f"🔧 [CONFIG] 환경 파일 선택: {selected_file} (환경: {env})")
+    logger.debug("🔧 [CONFIG] 환경 파일 선택: %s (환경: %s)", selected_file, env)
     return selected_file
 
 
+def _load_env_file() -> None:
+    """환경변수 파일 로드 (최초 호출 시 한 번만 실행)"""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+
+    # 현재 환경에 맞는 .env 파일 결정
+    env_file = get_env_file()
+
+    # 환경변수 파일이 존재하면 로드
+    if os.path.exists(env_file):
+        logger.debug("📄 [CONFIG] 환경변수 파일 로드: %s", env_file)
+        from dotenv import load_dotenv
+
+        load_dotenv(env_file, override=True)  # override=True로 기존 환경변수 덮어쓰기
+    else:
+        logger.warning("⚠️ [CONFIG] 환경변수 파일 없음: %s", env_file)
+
+    _ENV_LOADED = True
+
+
 class Settings(BaseSettings):
     """통합 설정 클래스"""
 
@@ -52,17 +81,30 @@ class Settings(BaseSettings):
     # === 데이터베이스 설정 ===
     VECTOR_DB_PATH: str = "./vectordb"
     COLLECTION_NAME: str = "law_documents"
+    VECTOR_DISTANCE_SPACE: str = "cosine"  # 벡터 거리 공간 (cosine | l2 | ip), 새 컬렉션 생성 시에만 적용
+    HNSW_M: int = 24  # HNSW 그래프 노드당 연결 수
+    HNSW_CONSTRUCTION_EF: int = 128  # 인덱스 구축 시 탐색 후보 수
+    HNSW_SEARCH_EF: int = 100  # 검색 시 탐색 후보 수
 
     # === 임베딩 모델 설정 ===
     EMBEDDING_MODEL: str = "jhgan/ko-sroberta-multitask"
+    EMBEDDING_BATCH_SIZE: int = 64  # 문서 임베딩 배치 크기
+    EMBEDDING_CACHE_PATH: str = "./cache/embeddings.sqlite3"  # 임베딩 캐시 DB 경로
+    EMBEDDING_BACKEND: str = "torch"  # 임베딩 추론 백엔드 (torch | onnx)
+    EMBEDDING_ONNX_DIR: str = "./models/onnx"  # ONNX 모델 내보내기 경로
+    EMBEDDING_ONNX_QUANTIZE: bool = False  # ONNX 모델 동적 int8 양자화 여부
+    EMBEDDING_NUM_THREADS: int = 0  # PyTorch CPU 추론 스레드 수 (0이면 CPU 코어 수)
+    EMBEDDING_FP16: bool = False  # GPU에서 FP16 추론 사용 여부 (벡터가 미세하게 달라짐)
 
     # === 문서 처리 설정 ===
     CHUNK_SIZE: int = 1000
     CHUNK_OVERLAP: int = 200
+    CHUNK_CACHE_PATH: str = "./cache/chunks.sqlite3"  # 파일별 청킹 결과 캐시 DB 경로
 
     # === RAG 설정 ===
     TOP_K_DOCUMENTS: int = 5
     SIMILARITY_THRESHOLD: float = 0.7
+    MAX_MEMORY_SESSIONS: int = 10000  # 대화 메모리를 유지할 최대 세션 수 (초과 시 가장 오래 사용하지 않은 세션 제거)
 
     # === 하이브리드 검색 가중치 ===
     BM25_WEIGHT: float = 0.3
@@ -75,6 +117,8 @@ class Settings(BaseSettings):
     # === 로깅 설정 ===
     LOG_LEVEL: str = "INFO"
     LOG_FILE: str = "logs/law_mate_api.log"
+    LOG_MAX_BYTES: int = 50 * 1024 * 1024  # 로그 파일 로테이션 크기
+    LOG_BACKUP_COUNT: int = 5  # 보관할 로테이션 파일 수
 
     # === 스케줄러 설정 ===
     ENABLE_SCHEDULER: bool = True
@@ -83,28 +127,21 @@ class Settings(BaseSettings):
     LAW_API_USER_ID: str = ""
 
     # === 환경별 .env 파일 로딩 (동적 로딩) ===
-    model_config = SettingsConfigDict(env_file_encoding="utf-8", case_sensitive=True, extra="ignore")
+    # 프로세스당 한 번 생성 후 변경되지 않으므로 frozen
+    model_config = SettingsConfigDict(
+        env_file_encoding="utf-8", case_sensitive=True, extra="ignore", validate_default=False, frozen=True
+    )
 
     def __init__(self, **kwargs):
         """초기화 시 동적으로 환경변수 파일 로드"""
-        # 현재 환경에 맞는 .env 파일 결정
-        env_file = get_env_file()
-
-        # 환경변수 파일이 존재하면 로드
-        if os.path.exists(env_file):
-            print(f"📄 [CONFIG] 환경변수 파일 로드: {env_file}")
-            from dotenv import load_dotenv
-
-            load_dotenv(env_file, override=True)  # override=True로 기존 환경변수 덮어쓰기
-        else:
-            print(f"⚠️ [CONFIG] 환경변수 파일 없음: {env_file}")
+        _load_env_file()
 
         # 부모 클래스 초기화
         super().__init__(**kwargs)
 
-    @property
+    @cached_property
     def ALLOWED_ORIGINS(self) -> List[str]:
-        """CORS 허용 오리진 목록 (환경별)"""
+        """CORS 허용 오리진 목록 (환경별, 최초 접근 시 한 번만 생성)"""
         if self.ENVIRONMENT.lower() == "development":
             return [
                 "http://localhost:3000",  # React 개발 서버
@@ -125,8 +162,6 @@ class Settings(BaseSettings):
 
     def model_post_init(self, __context) -> None:
         """초기화 후 필수 디렉토리 생성 및 검증 (한 번만 실행)"""
-        print(f"🔧 [CONFIG] Settings 초기화 완료 - 환경: {self.ENVIRONMENT}")
-
         # 필수 디렉토리 생성
         dirs = [
             os.path.dirname(self.LOG_FILE) if self.LOG_FILE else None,
@@ -138,39 +173,32 @@ class Settings(BaseSettings):
         for directory in dirs:
             if directory:
                 os.makedirs(directory, exist_ok=True)
-                print(f"📁 [CONFIG] 디렉토리 확인: {directory}")
-
-        # 환경별 추가 설정
-        self._apply_environment_overrides()
 
         # 설정 검증
         self._validate_settings()
 
-    def _apply_environment_overrides(self) -> None:
-        """환경별 설정 오버라이드"""
-        env = self.ENVIRONMENT.lower()
+    @model_validator(mode="before")
+    @classmethod
+    def _apply_environment_overrides(cls, data: Any) -> Any:
+        """환경별 설정 오버라이드 (필드 검증 전 입력값에 적용)"""
+        if not isinstance(data, dict):
+            return data
+
+        env = str(data.get("ENVIRONMENT", cls.model_fields["ENVIRONMENT"].default)).lower()
 
         if env == "development":
             # 개발 환경 오버라이드
-            object.__setattr__(self, "DEBUG", True)
-            object.__setattr__(self, "LOG_LEVEL", "DEBUG")
-            object.__setattr__(self, "ENABLE_SCHEDULER", False)
-            print("⚙️ [CONFIG] 개발 환경 설정 적용")
+            data.update(DEBUG=True, LOG_LEVEL="DEBUG", ENABLE_SCHEDULER=False)
 
         elif env == "production":
             # 프로덕션 환경 오버라이드
-            object.__setattr__(self, "DEBUG", False)
-            object.__setattr__(self, "LOG_LEVEL", "WARNING")
-            object.__setattr__(self, "ENABLE_SCHEDULER", True)
-            print("🏭 [CONFIG] 프로덕션 환경 설정 적용")
+            data.update(DEBUG=False, LOG_LEVEL="WARNING", ENABLE_SCHEDULER=True)
 
         elif env == "test":
             # 테스트 환경 오버라이드
-            object.__setattr__(self, "DEBUG", True)
-            object.__setattr__(self, "LOG_LEVEL", "DEBUG")
-            object.__setattr__(self, "ENABLE_SCHEDULER", False)
-            object.__setattr__(self, "VECTOR_DB_PATH", "./vectordb_test")
-            print("🧪 [CONFIG] 테스트 환경 설정 적용")
+            data.update(DEBUG=True, LOG_LEVEL="DEBUG", ENABLE_SCHEDULER=False, VECTOR_DB_PATH="./vectordb_test")
+
+        return data
 
     def _validate_settings(self) -> None:
         """설정 검증"""
@@ -183,12 +211,19 @@ class Settings(BaseSettings):
         if abs(weight_sum - 1.0) > 0.01:
             raise ValueError(f"❌ 검색 가중치 합계가 1.0이 아닙니다: {weight_sum}")
 
-        print(f"✅ [CONFIG] 설정 검증 완료")
+        # 청킹 설정 검증
+        if not 0 <= self.CHUNK_OVERLAP < self.CHUNK_SIZE:
+            raise ValueError(f"❌ CHUNK_OVERLAP은 0 이상 CHUNK_SIZE 미만이어야 합니다: {self.CHUNK_OVERLAP}")
+
+        # 벡터 거리 공간 검증
+        if self.VECTOR_DISTANCE_SPACE not in ("cosine", "l2", "ip"):
+            raise ValueError(f"❌ 지원하지 않는 벡터 거리 공간입니다: {self.VECTOR_DISTANCE_SPACE}")
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """설정 인스턴스 반환 (환경 변경 시 새로운 인스턴스 생성)"""
-    print("🚀 [CONFIG] Settings 인스턴스 생성")
+    """설정 인스턴스 반환 (프로세스당 한 번만 생성)"""
+    logger.debug("🚀 [CONFIG] Settings 인스턴스 생성")
     return Settings()
 
 
@@ -4,33 +4,83 @@ FastAPI 의존성 주입에 사용되는 함수들을 정의합니다.
 """
 
 import time
-from typing import Optional
-from fastapi import HTTPException, status
+from typing import Callable, Type, TypeVar
+
+import httpx
+import msgspec
+from fastapi import HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
 
 from core.logging.config import get_logger
 
 logger = get_logger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 # 전역 변수
-app_start_time = time.time()
-rag_orchestrator_instance: Optional[object] = None
+app_start_time = time.monotonic()
 
 
 def get_app_uptime() -> float:
     """앱 가동 시간 반환"""
-    return time.time() - app_start_time
-
-
-def set_rag_orchestrator(orchestrator) -> None:
-    """RAG 오케스트레이터 인스턴스 설정"""
-    global rag_orchestrator_instance
-    rag_orchestrator_instance = orchestrator
+    return time.monotonic() - app_start_time
 
 
-def get_rag_orchestrator():
-    """RAG 오케스트레이터 의존성 주입"""
-    if rag_orchestrator_instance is None:
+def get_rag_orchestrator(request: Request):
+    """RAG 오케스트레이터 의존성 주입 (lifespan에서 app.state에 등록)"""
+    rag_orchestrator = getattr(request.app.state, "rag_orchestrator", None)
+    if rag_orchestrator is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="RAG 시스템이 초기화되지 않았습니다. 잠시 후 다시 시도해주세요."
         )
-    return rag_orchestrator_instance
+    return rag_orchestrator
+
+
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """공유 HTTP 클라이언트 의존성 주입 (lifespan에서 생성)"""
+    http_client = getattr(request.app.state, "http_client", None)
+    if http_client is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="HTTP 클라이언트가 초기화되지 않았습니다.")
+    return http_client
+
+
+def json_body(model: Type[ModelT]) -> Callable:
+    """
+    요청 본문 의존성 생성
+    FastAPI의 json.loads → dict 검증 2단계 대신 model_validate_json으로
+    원본 바이트를 한 번에 파싱·검증합니다.
+    """
+
+    async def dependency(request: Request) -> ModelT:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            # FastAPI 기본 검증 오류와 동일한 형식(loc: body.*)으로 422 반환
+            errors = e.errors(include_url=False)
+            for error in errors:
+                error["loc"] = ("body", *error["loc"])
+            raise RequestValidationError(errors)
+
+    return dependency
+
+
+def json_body_openapi(model: Type[BaseModel]) -> dict:
+    """json_body 사용 엔드포인트의 OpenAPI 요청 본문 스키마"""
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+            "required": True,
+        }
+    }
+
+
+def struct_response_openapi(struct_type: Type[msgspec.Struct]) -> dict:
+    """msgspec.Struct 응답의 OpenAPI 스키마 (responses= 인자용)"""
+    (_,), components = msgspec.json.schema_components([struct_type], ref_template="#/components/schemas/{name}")
+    return {
+        200: {
+            "description": "Successful Response",
+            "content": {"application/json": {"schema": components[struct_type.__name__]}},
+        }
+    }
@@ -3,30 +3,128 @@
 전체 애플리케이션의 로깅 설정을 중앙화하여 관리합니다.
 """
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 from pathlib import Path
+from typing import Optional
 from core.config import get_settings
 
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# 로그 파일 버퍼 크기 및 강제 flush 주기 (레코드 수)
+LOG_FILE_BUFFER_SIZE = 64 * 1024
+LOG_FILE_FLUSH_EVERY = 100
+
+# 백그라운드 로그 기록 스레드 (setup_logging 재호출 시 교체)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    버퍼링 + 크기 기반 로테이션 파일 핸들러
+    WARNING 이상 레코드이거나 일정 개수마다만 flush하여 레코드당 write 시스템 콜을 줄이고,
+    파일 크기가 maxBytes에 도달하면 backupCount개까지 로테이션합니다.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        flush_every: int = LOG_FILE_FLUSH_EVERY,
+        buffer_size: int = LOG_FILE_BUFFER_SIZE,
+    ):
+        self.flush_every = flush_every
+        self.buffer_size = buffer_size
+        self._pending = 0
+        self._bytes_written = 0
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, encoding="utf-8", delay=True)
+
+    def _open(self):
+        stream = open(
+            self.baseFilename, self.mode, encoding=self.encoding, errors=self.errors, buffering=self.buffer_size
+        )
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            size = len(msg.encode(self.encoding, errors="replace"))
+
+            # 버퍼를 비우지 않도록 파일 위치 대신 누적 크기로 로테이션 판단
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._bytes_written + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+
+            self.stream.write(msg)
+            self._bytes_written += size
+            self._pending += 1
+            if record.levelno >= logging.WARNING or self._pending >= self.flush_every:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        super().flush()
+        self._pending = 0
+
+
+def _stop_queue_listener() -> None:
+    """백그라운드 로그 스레드 종료 (남은 레코드 기록 후 파일 닫기)"""
+    global _queue_listener
+    if _queue_listener is None:
+        return
+
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.close()
+    _queue_listener = None
+
 
 def setup_logging() -> None:
     """애플리케이션 로깅 설정"""
+    global _queue_listener
+
     settings = get_settings()
     log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
 
-    # 핸들러 설정
+    # 실제 출력 핸들러 설정 (백그라운드 스레드에서 실행)
+    formatter = logging.Formatter(LOG_FORMAT)
     handlers = [logging.StreamHandler(sys.stdout)]
 
     # 파일 핸들러 추가
     if settings.LOG_FILE:
         log_path = Path(settings.LOG_FILE)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        handlers.append(logging.FileHandler(settings.LOG_FILE, encoding="utf-8"))
+        handlers.append(
+            BufferedRotatingFileHandler(
+                settings.LOG_FILE, maxBytes=settings.LOG_MAX_BYTES, backupCount=settings.LOG_BACKUP_COUNT
+            )
+        )
+
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # 기존 리스너 정리 후 새 리스너 시작
+    _stop_queue_listener()
+    log_queue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+    # 요청 경로에서는 큐에 넣기만 하도록 루트 로거에 QueueHandler만 등록
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
 
     # 기본 로깅 설정
-    logging.basicConfig(
-        level=log_level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", handlers=handlers, force=True
-    )
+    logging.basicConfig(level=log_level, handlers=[queue_handler], force=True)
 
     # 외부 라이브러리 로깅 레벨 조정 (필수만)
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -37,6 +135,9 @@ def setup_logging() -> None:
     logger.info(f"✅ 로깅 설정 완료 - 레벨: {settings.LOG_LEVEL}")
 
 
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """모듈별 로거 반환"""
     return logging.getLogger(name)
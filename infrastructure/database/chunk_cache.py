@@ -0,0 +1,68 @@
+"""
+문서 청크 캐시
+SQLite를 사용해 파일별 청킹 결과를 (경로, 수정 시각, 크기, 청킹 설정) 기준으로 영구 저장합니다.
+변경되지 않은 파일은 재수집 시 읽기, 디코딩, 전처리, 청킹을 모두 건너뜁니다.
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+from core.logging.config import get_logger
+
+logger = get_logger(__name__)
+
+
+class ChunkCache:
+    """SQLite 기반 문서 청크 캐시"""
+
+    def __init__(self, db_path: str):
+        self.db_path = os.path.abspath(db_path)
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS chunks ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, "
+            "chunk_size INTEGER NOT NULL, chunk_overlap INTEGER NOT NULL, data BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        logger.info(f"✅ 청크 캐시 연결: {self.db_path}")
+
+    def get(
+        self, path: str, mtime_ns: int, size: int, chunk_size: int, chunk_overlap: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """파일 상태와 청킹 설정이 모두 일치할 때만 캐시된 청크 반환"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM chunks WHERE path = ? AND mtime_ns = ? AND size = ? "
+                "AND chunk_size = ? AND chunk_overlap = ?",
+                (path, mtime_ns, size, chunk_size, chunk_overlap),
+            ).fetchone()
+
+        return orjson.loads(row[0]) if row else None
+
+    def put(
+        self, path: str, mtime_ns: int, size: int, chunk_size: int, chunk_overlap: int, chunks: List[Dict[str, Any]]
+    ) -> None:
+        """파일의 청킹 결과 저장 (같은 경로의 이전 결과는 교체)"""
+        data = orjson.dumps(chunks)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO chunks (path, mtime_ns, size, chunk_size, chunk_overlap, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (path, mtime_ns, size, chunk_size, chunk_overlap, data),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """연결 종료"""
+        with self._lock:
+            self._conn.close()
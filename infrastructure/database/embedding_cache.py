@@ -0,0 +1,82 @@
+"""
+임베딩 캐시
+SQLite를 사용해 텍스트 임베딩을 (SHA-256(텍스트), 모델명) 키로 영구 저장합니다.
+저장 공간과 I/O를 줄이기 위해 벡터는 float16으로 저장하고 조회 시 float32로 복원합니다.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from core.logging.config import get_logger
+
+logger = get_logger(__name__)
+
+# 저장용 벡터 자료형 (문장 임베딩의 값 범위에서는 float16 정밀도로 검색 품질 차이가 미미함)
+STORAGE_DTYPE = np.float16
+
+
+def content_hash(text: str) -> bytes:
+    """캐시 키로 사용할 텍스트의 SHA-256 다이제스트"""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """SQLite 기반 임베딩 캐시"""
+
+    # SQLite 바인딩 변수 개수 제한(기본 999)을 넘지 않도록 조회를 나눔
+    _LOOKUP_BATCH_SIZE = 500
+
+    def __init__(self, db_path: str, model_name: str):
+        self.db_path = os.path.abspath(db_path)
+        self.model_name = model_name
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "hash BLOB NOT NULL, model TEXT NOT NULL, vec BLOB NOT NULL, "
+            "PRIMARY KEY (hash, model)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+        logger.info(f"✅ 임베딩 캐시 연결: {self.db_path}")
+
+    def get_many(self, hashes: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """해시 목록에 대한 캐시된 임베딩 조회 (없는 항목은 결과에서 제외)"""
+        found: Dict[bytes, np.ndarray] = {}
+        unique_hashes = list(dict.fromkeys(hashes))
+
+        with self._lock:
+            for start in range(0, len(unique_hashes), self._LOOKUP_BATCH_SIZE):
+                batch = unique_hashes[start : start + self._LOOKUP_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT hash, vec FROM embeddings WHERE model = ? AND hash IN ({placeholders})",
+                    (self.model_name, *batch),
+                ).fetchall()
+                for h, vec in rows:
+                    found[h] = np.frombuffer(vec, dtype=STORAGE_DTYPE).astype(np.float32)
+
+        return found
+
+    def put_many(self, items: Iterable[Tuple[bytes, np.ndarray]]) -> None:
+        """(해시, 임베딩) 쌍을 캐시에 저장"""
+        rows = [(h, self.model_name, np.asarray(vec, dtype=STORAGE_DTYPE).tobytes()) for h, vec in items]
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings (hash, model, vec) VALUES (?, ?, ?)", rows)
+            self._conn.commit()
+
+    def close(self) -> None:
+        """연결 종료"""
+        with self._lock:
+            self._conn.close()
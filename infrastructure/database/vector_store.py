@@ -3,18 +3,90 @@
 ChromaDB를 사용한 벡터 데이터베이스 관리를 담당합니다.
 """
 
+import asyncio
+import json
 import os
 import uuid
+from collections import Counter
+from functools import lru_cache
 import chromadb
+import numpy as np
+import torch
 from chromadb.config import Settings as ChromaSettings
-from typing import List, Dict, Any
+from typing import Any, AsyncIterator, Dict, List, Optional
 from sentence_transformers import SentenceTransformer
 
 from core.config import get_settings
 from core.logging.config import get_logger
+from infrastructure.database.embedding_cache import EmbeddingCache, content_hash
 
 logger = get_logger(__name__)
 
+QUERY_EMBEDDING_CACHE_SIZE = 2048
+HEALTH_CHECK_QUERY = "테스트"
+
+_torch_threads_configured = False
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _join_list(value: list) -> str:
+    return ", ".join(str(v) for v in value)
+
+
+def _dump_dict(value: dict) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+# ChromaDB 메타데이터 값 변환 테이블 (정확한 타입 기준, ChromaDB는 문자열/숫자/불리언만 지원)
+_METADATA_CONVERTERS = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    list: _join_list,  # 리스트는 문자열로 변환
+    dict: _dump_dict,  # 딕셔너리는 JSON 문자열로 변환
+}
+
+
+def _convert_metadata_value(value: Any) -> Any:
+    """변환 테이블에 없는 타입(하위 클래스 등)의 메타데이터 값 변환"""
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, list):
+        return _join_list(value)
+    if isinstance(value, dict):
+        return _dump_dict(value)
+    # 기타는 문자열로 변환
+    return str(value)
+
+
+def _configure_torch_threads(num_threads: int) -> None:
+    """PyTorch CPU 스레드 수 설정 (프로세스당 한 번, 0이면 CPU 코어 수 사용)"""
+    global _torch_threads_configured
+    if _torch_threads_configured:
+        return
+    _torch_threads_configured = True
+
+    torch.set_num_threads(num_threads or os.cpu_count() or 4)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # 이미 병렬 작업이 시작된 뒤에는 변경 불가
+        pass
+
+
+@lru_cache(maxsize=None)
+def _load_sentence_transformer(model_name: str, fp16: bool = False) -> SentenceTransformer:
+    """SentenceTransformer 로드 (같은 모델은 프로세스 내에서 하나의 인스턴스를 공유)"""
+    model = SentenceTransformer(model_name)
+    model.eval()
+    if fp16 and model.device.type == "cuda":
+        model.half()
+    return model
+
 
 class VectorStore:
     """벡터 스토어"""
@@ -24,11 +96,23 @@ class VectorStore:
         self.client = None
         self.collection = None
         self.embedding_model = None
+        self.embedding_model_name = None
+        self.embedding_cache = None
         self.document_count = 0
+        # 소스별 문서 수 (첫 조회 시 한 번 집계 후 추가/삭제 시 증분 갱신, None이면 미집계)
+        self._source_counts: Optional[Counter] = None
+        # 컬렉션의 실제 거리 공간 (기존 컬렉션은 생성 시 설정을 유지하므로 설정값과 다를 수 있음)
+        self.distance_space = "l2"
 
         # 초기화
         self._initialize_chromadb()
         self._initialize_embedding_model()
+        self._initialize_embedding_cache()
+
+        # 쿼리 임베딩 인메모리 캐시 (인스턴스별, 모델이 고정되므로 쿼리 문자열만 키로 사용)
+        self._encode_query = lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)(self._encode_query_uncached)
+        # 상태 확인용 고정 쿼리 임베딩 (모델이 고정이므로 한 번만 계산)
+        self._health_check_embedding = self._encode(HEALTH_CHECK_QUERY)
 
     def _initialize_chromadb(self):
         """ChromaDB 클라이언트 초기화"""
@@ -48,24 +132,97 @@ class VectorStore:
             try:
                 self.collection = self.client.get_collection(name=self.settings.COLLECTION_NAME)
                 self.document_count = self.collection.count()
+                self.distance_space = (self.collection.metadata or {}).get("hnsw:space", "l2")
                 logger.info(f"✅ 기존 컬렉션 로드: {self.settings.COLLECTION_NAME} ({self.document_count}개 문서)")
+
+                if self.distance_space != self.settings.VECTOR_DISTANCE_SPACE:
+                    logger.warning(
+                        f"⚠️ 기존 컬렉션 거리 공간({self.distance_space})이 설정({self.settings.VECTOR_DISTANCE_SPACE})과 "
+                        "다릅니다. 적용하려면 컬렉션을 재생성하세요"
+                    )
             except Exception:
                 # 컬렉션이 없으면 새로 생성
-                self.collection = self.client.create_collection(
-                    name=self.settings.COLLECTION_NAME, metadata={"description": "Law Mate 법률 문서 컬렉션"}
-                )
+                self._create_collection()
                 logger.info(f"✅ 새 컬렉션 생성: {self.settings.COLLECTION_NAME}")
 
         except Exception as e:
             logger.error(f"❌ ChromaDB 초기화 실패: {str(e)}")
             raise
 
+    def _collection_metadata(self) -> Dict[str, Any]:
+        """설정된 HNSW 인덱스 파라미터를 포함한 컬렉션 메타데이터"""
+        return {
+            "description": "Law Mate 법률 문서 컬렉션",
+            "hnsw:space": self.settings.VECTOR_DISTANCE_SPACE,
+            "hnsw:M": self.settings.HNSW_M,
+            "hnsw:construction_ef": self.settings.HNSW_CONSTRUCTION_EF,
+            "hnsw:search_ef": self.settings.HNSW_SEARCH_EF,
+        }
+
+    def _create_collection(self):
+        """설정된 HNSW 인덱스 파라미터로 컬렉션 생성"""
+        self.collection = self.client.create_collection(
+            name=self.settings.COLLECTION_NAME, metadata=self._collection_metadata()
+        )
+        self.distance_space = self.settings.VECTOR_DISTANCE_SPACE
+
+    def _prepare_embeddings(self, vectors: np.ndarray) -> np.ndarray:
+        """cosine/ip 공간이면 단위 벡터로 정규화 (l2 공간은 기존 벡터와의 호환을 위해 그대로 사용)"""
+        if self.distance_space == "l2":
+            return vectors
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.clip(norms, 1e-12, None)
+
+    def _distances_to_similarities(self, distances: np.ndarray) -> np.ndarray:
+        """거리 배열을 유사도 배열로 변환 (거리가 작을수록 유사도가 높음)"""
+        if self.distance_space == "l2":
+            return 1.0 / (1.0 + distances)
+        # cosine: 1 - cos, ip: 1 - dot (정규화된 벡터이므로 둘 다 코사인 유사도)
+        return 1.0 - distances
+
+    def _build_search_results(
+        self, documents: List[str], metadatas: List[Dict[str, Any]], distances: List[float], similarity_threshold: float
+    ) -> List[Dict[str, Any]]:
+        """단일 쿼리의 ChromaDB 결과를 유사도 임계값으로 필터링해 검색 결과로 변환"""
+        if not documents:
+            return []
+
+        distance_array = np.asarray(distances, dtype=np.float64)
+        similarities = self._distances_to_similarities(distance_array)
+        kept = np.flatnonzero(similarities >= similarity_threshold).tolist()
+
+        similarity_list = similarities.tolist()
+        return [
+            {
+                "content": documents[i],
+                "source": metadatas[i].get("source", "unknown"),
+                "metadata": metadatas[i],
+                "similarity_score": similarity_list[i],
+                "distance": distances[i],
+                "rank": i + 1,
+            }
+            for i in kept
+        ]
+
     def _initialize_embedding_model(self):
         """임베딩 모델 초기화"""
         try:
             logger.info(f"🤖 임베딩 모델 로드 중: {self.settings.EMBEDDING_MODEL}")
 
-            self.embedding_model = SentenceTransformer(self.settings.EMBEDDING_MODEL)
+            if self.settings.EMBEDDING_BACKEND == "onnx":
+                try:
+                    self._initialize_onnx_embedding_model()
+                    return
+                except Exception as onnx_error:
+                    logger.warning(f"⚠️ ONNX 임베딩 모델 로드 실패, PyTorch로 진행: {str(onnx_error)}")
+
+            _configure_torch_threads(self.settings.EMBEDDING_NUM_THREADS)
+            fp16 = self.settings.EMBEDDING_FP16
+            self.embedding_model = _load_sentence_transformer(self.settings.EMBEDDING_MODEL, fp16)
+            self.embedding_model_name = self.settings.EMBEDDING_MODEL
+            # FP16 추론은 벡터가 미세하게 달라지므로 캐시 키를 구분
+            if fp16 and self.embedding_model.device.type == "cuda":
+                self.embedding_model_name += "@fp16"
 
             logger.info("✅ 임베딩 모델 로드 완료")
 
@@ -74,12 +231,79 @@ class VectorStore:
             # 기본 모델로 폴백
             try:
                 logger.warning("🔄 기본 임베딩 모델로 폴백 시도...")
-                self.embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
+                self.embedding_model = _load_sentence_transformer("all-MiniLM-L6-v2")
+                self.embedding_model_name = "all-MiniLM-L6-v2"
                 logger.info("✅ 기본 임베딩 모델 로드 완료")
             except Exception as fallback_error:
                 logger.error(f"❌ 기본 임베딩 모델 로드도 실패: {str(fallback_error)}")
                 raise
 
+    def _initialize_onnx_embedding_model(self):
+        """ONNX Runtime 임베딩 모델 초기화"""
+        from infrastructure.ml.onnx_embedder import OnnxEmbedder
+
+        quantize = self.settings.EMBEDDING_ONNX_QUANTIZE
+        self.embedding_model = OnnxEmbedder(
+            self.settings.EMBEDDING_MODEL, export_dir=self.settings.EMBEDDING_ONNX_DIR, quantize=quantize
+        )
+        # 양자화 모델은 벡터가 달라지므로 캐시 키를 구분
+        self.embedding_model_name = f"{self.settings.EMBEDDING_MODEL}@onnx{'-int8' if quantize else ''}"
+
+        logger.info(f"✅ ONNX 임베딩 모델 로드 완료 (int8 양자화: {quantize})")
+
+    def _initialize_embedding_cache(self):
+        """임베딩 캐시 초기화 (실패해도 캐시 없이 동작)"""
+        try:
+            self.embedding_cache = EmbeddingCache(self.settings.EMBEDDING_CACHE_PATH, self.embedding_model_name)
+        except Exception as e:
+            logger.warning(f"⚠️ 임베딩 캐시 초기화 실패, 캐시 없이 진행: {str(e)}")
+            self.embedding_cache = None
+
+    def _encode(self, sentences, **kwargs) -> np.ndarray:
+        """임베딩 모델 추론 (autograd 기록 없이 실행)"""
+        with torch.inference_mode():
+            return self.embedding_model.encode(sentences, convert_to_numpy=True, show_progress_bar=False, **kwargs)
+
+    def _encode_query_uncached(self, query: str) -> np.ndarray:
+        """쿼리 임베딩 생성"""
+        return self._encode(query)
+
+    def _encode_documents(self, texts: List[str]) -> np.ndarray:
+        """문서 임베딩 생성 (캐시에 있는 텍스트는 재계산하지 않음)"""
+        dim = self.embedding_model.get_sentence_embedding_dimension()
+        embeddings = np.empty((len(texts), dim), dtype=np.float32)
+
+        hashes = [content_hash(text) for text in texts]
+        cached = {}
+        if self.embedding_cache is not None:
+            try:
+                cached = self.embedding_cache.get_many(hashes)
+            except Exception as e:
+                logger.warning(f"⚠️ 임베딩 캐시 조회 실패: {str(e)}")
+
+        uncached_indices = []
+        for i, h in enumerate(hashes):
+            vec = cached.get(h)
+            if vec is not None and vec.shape[0] == dim:
+                embeddings[i] = vec
+            else:
+                uncached_indices.append(i)
+
+        logger.debug(f"📦 임베딩 캐시: {len(texts) - len(uncached_indices)}개 적중, {len(uncached_indices)}개 계산")
+
+        if uncached_indices:
+            # SentenceTransformer.encode는 내부에서 길이순 정렬 후 배치 처리하므로 패딩 낭비가 적음
+            fresh = self._encode([texts[i] for i in uncached_indices], batch_size=self.settings.EMBEDDING_BATCH_SIZE)
+            embeddings[uncached_indices] = fresh
+
+            if self.embedding_cache is not None:
+                try:
+                    self.embedding_cache.put_many((hashes[i], embeddings[i]) for i in uncached_indices)
+                except Exception as e:
+                    logger.warning(f"⚠️ 임베딩 캐시 저장 실패: {str(e)}")
+
+        return embeddings
+
     async def add_documents(self, documents: List[Dict[str, Any]]) -> bool:
         """문서를 벡터 DB에 추가"""
         try:
@@ -93,9 +317,9 @@ class VectorStore:
             ids = []
             contents = []
             metadatas = []
-            embeddings = []
+            nonempty_indices = []
 
-            for doc in documents:
+            for i, doc in enumerate(documents):
                 # 고유 ID 생성
                 doc_id = doc.get("id", str(uuid.uuid4()))
                 ids.append(doc_id)
@@ -111,18 +335,26 @@ class VectorStore:
                 clean_metadata["source"] = doc.get("source", "unknown")
                 metadatas.append(clean_metadata)
 
-                # 임베딩 생성
                 if content:
-                    embedding = self.embedding_model.encode(content).tolist()
-                    embeddings.append(embedding)
+                    nonempty_indices.append(i)
                 else:
                     logger.warning(f"⚠️ 빈 문서 내용: {doc_id}")
-                    embeddings.append([0.0] * self.embedding_model.get_sentence_embedding_dimension())
 
-            # ChromaDB에 추가
+            # 임베딩 일괄 생성 (빈 문서는 0 벡터 유지)
+            dim = self.embedding_model.get_sentence_embedding_dimension()
+            embeddings = np.zeros((len(documents), dim), dtype=np.float32)
+            if nonempty_indices:
+                embeddings[nonempty_indices] = self._prepare_embeddings(
+                    self._encode_documents([contents[i] for i in nonempty_indices])
+                )
+
+            # ChromaDB에 추가 (임베딩은 Python 리스트 변환 없이 ndarray로 전달)
             self.collection.add(ids=ids, documents=contents, metadatas=metadatas, embeddings=embeddings)
 
-            self.document_count = self.collection.count()
+            # count() 왕복 없이 로컬에서 증분 갱신 (health_check에서 실제 값으로 보정)
+            self.document_count += len(ids)
+            if self._source_counts is not None:
+                self._source_counts.update(metadata["source"] for metadata in metadatas)
             logger.info(f"✅ 벡터 DB 문서 추가 완료: 총 {self.document_count}개 문서")
             return True
 
@@ -130,6 +362,27 @@ class VectorStore:
             logger.error(f"❌ 벡터 DB 문서 추가 실패: {str(e)}")
             return False
 
+    def _search_with_embedding(
+        self, query_embedding: np.ndarray, top_k: int, similarity_threshold: float = 0.0
+    ) -> List[Dict[str, Any]]:
+        """미리 계산된 쿼리 임베딩으로 유사도 검색 (임베딩 생성 생략, 실패 시 예외 전파)"""
+        results = self.collection.query(
+            query_embeddings=self._prepare_embeddings(query_embedding)[None, :],
+            n_results=top_k,
+            include=["documents", "metadatas", "distances"],
+        )
+
+        # 결과 변환 (유사도 계산 및 임계값 필터링은 벡터 연산으로 일괄 처리)
+        if not results["documents"]:
+            return []
+        return self._build_search_results(
+            results["documents"][0], results["metadatas"][0], results["distances"][0], similarity_threshold
+        )
+
+    def _search_query(self, query: str, top_k: int, similarity_threshold: float) -> List[Dict[str, Any]]:
+        """쿼리 임베딩 생성 후 유사도 검색 (블로킹, 실패 시 예외 전파)"""
+        return self._search_with_embedding(self._encode_query(query), top_k, similarity_threshold)
+
     async def search_similar(
         self, query: str, top_k: int = 5, similarity_threshold: float = 0.0
     ) -> List[Dict[str, Any]]:
@@ -141,62 +394,83 @@ class VectorStore:
                 logger.warning("⚠️ 빈 검색 쿼리")
                 return []
 
-            # 쿼리 임베딩 생성
-            query_embedding = self.embedding_model.encode(query).tolist()
+            # 쿼리 임베딩 생성과 검색은 블로킹 연산이므로 스레드에서 수행 (이벤트 루프의 다른 작업과 겹쳐 실행)
+            search_results = await asyncio.to_thread(self._search_query, query, top_k, similarity_threshold)
+
+            logger.debug(f"✅ 벡터 검색 완료: {len(search_results)}개 결과")
+            return search_results
+
+        except Exception as e:
+            logger.error(f"❌ 벡터 검색 실패: {str(e)}")
+            return []
+
+    async def search_similar_many(
+        self, queries: List[str], top_k: int = 5, similarity_threshold: float = 0.0
+    ) -> List[List[Dict[str, Any]]]:
+        """여러 쿼리의 유사도 검색을 한 번의 임베딩 배치와 한 번의 ChromaDB 쿼리로 처리"""
+        try:
+            logger.debug(f"🔍 벡터 배치 검색: {len(queries)}개 쿼리 (top_k={top_k})")
+
+            all_results: List[List[Dict[str, Any]]] = [[] for _ in queries]
+            valid_indices = [i for i, query in enumerate(queries) if query.strip()]
+            if not valid_indices:
+                return all_results
+
+            # 쿼리 임베딩 일괄 생성
+            query_embeddings = self._prepare_embeddings(
+                self._encode([queries[i] for i in valid_indices], batch_size=self.settings.EMBEDDING_BATCH_SIZE)
+            )
 
-            # ChromaDB 검색
+            # ChromaDB 다중 쿼리 검색
             results = self.collection.query(
-                query_embeddings=[query_embedding],
-                n_results=min(top_k, self.document_count) if self.document_count > 0 else top_k,
+                query_embeddings=query_embeddings,
+                n_results=top_k,
                 include=["documents", "metadatas", "distances"],
             )
 
-            # 결과 변환
-            search_results = []
-            if results["documents"] and results["documents"][0]:
-                for i, (doc, metadata, distance) in enumerate(
-                    zip(results["documents"][0], results["metadatas"][0], results["distances"][0])
-                ):
-                    # 거리를 유사도로 변환 (거리가 작을수록 유사도가 높음)
-                    similarity = 1.0 / (1.0 + distance)
-
-                    if similarity >= similarity_threshold:
-                        search_results.append(
-                            {
-                                "content": doc,
-                                "source": metadata.get("source", "unknown"),
-                                "metadata": metadata,
-                                "similarity_score": similarity,
-                                "distance": distance,
-                                "rank": i + 1,
-                            }
-                        )
+            for result_index, query_index in enumerate(valid_indices):
+                all_results[query_index] = self._build_search_results(
+                    results["documents"][result_index],
+                    results["metadatas"][result_index],
+                    results["distances"][result_index],
+                    similarity_threshold,
+                )
 
-            logger.debug(f"✅ 벡터 검색 완료: {len(search_results)}개 결과")
-            return search_results
+            logger.debug(f"✅ 벡터 배치 검색 완료: {sum(len(r) for r in all_results)}개 결과")
+            return all_results
 
         except Exception as e:
-            logger.error(f"❌ 벡터 검색 실패: {str(e)}")
-            return []
+            logger.error(f"❌ 벡터 배치 검색 실패: {str(e)}")
+            return [[] for _ in queries]
 
     async def delete_documents(self, document_ids: List[str]) -> bool:
         """문서 삭제"""
         try:
+            if not document_ids:
+                logger.warning("⚠️ 삭제할 문서가 없습니다")
+                return True
+
             logger.info(f"🗑️ {len(document_ids)}개 문서 삭제 중...")
 
-            # 존재하는 문서 ID만 필터링
-            existing_ids = []
-            for doc_id in document_ids:
-                try:
-                    result = self.collection.get(ids=[doc_id])
-                    if result["ids"]:
-                        existing_ids.append(doc_id)
-                except Exception:
-                    logger.warning(f"⚠️ 문서 ID 없음: {doc_id}")
+            # 존재하는 문서 ID만 한 번의 조회로 필터링
+            found = self.collection.get(ids=list(document_ids), include=["metadatas"])
+            found_sources = {
+                doc_id: (metadata or {}).get("source", "unknown")
+                for doc_id, metadata in zip(found["ids"], found["metadatas"])
+            }
+            existing_ids = [doc_id for doc_id in dict.fromkeys(document_ids) if doc_id in found_sources]
+
+            missing_count = len(set(document_ids)) - len(existing_ids)
+            if missing_count:
+                logger.warning(f"⚠️ 존재하지 않는 문서 ID {missing_count}개 제외")
 
             if existing_ids:
                 self.collection.delete(ids=existing_ids)
-                self.document_count = self.collection.count()
+                self.document_count -= len(existing_ids)
+                if self._source_counts is not None:
+                    self._source_counts.subtract(found_sources[doc_id] for doc_id in existing_ids)
+                    # 개수가 0이 된 소스 제거
+                    self._source_counts = +self._source_counts
                 logger.info(f"✅ {len(existing_ids)}개 문서 삭제 완료")
             else:
                 logger.warning("⚠️ 삭제할 문서가 없습니다")
@@ -214,11 +488,10 @@ class VectorStore:
 
             # 컬렉션 삭제 후 재생성
             self.client.delete_collection(name=self.settings.COLLECTION_NAME)
-            self.collection = self.client.create_collection(
-                name=self.settings.COLLECTION_NAME, metadata={"description": "Law Mate 법률 문서 컬렉션"}
-            )
+            self._create_collection()
 
             self.document_count = 0
+            self._source_counts = Counter()
             logger.info("✅ 컬렉션 전체 삭제 완료")
             return True
 
@@ -256,56 +529,52 @@ class VectorStore:
             logger.error(f"❌ 통계 정보 조회 실패: {str(e)}")
             return {"total_documents": self.document_count, "error": str(e)}
 
+    async def iter_all_documents(self, batch_size: int = 1000) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        모든 문서를 배치 단위로 순회
+        ChromaDB의 실제 문서 ID를 유지하며, 한 번에 배치 하나만 메모리에 올립니다.
+        """
+        logger.info(f"📄 모든 문서 순회 중... (배치 {batch_size}개)")
+
+        # 로컬 문서 수는 다른 인스턴스의 변경을 반영하지 못할 수 있으므로 빈 배치가 나올 때까지 조회
+        # (조회 실패는 건너뛰지 않고 호출자에게 전파해 일부 문서만 읽힌 채 진행되지 않도록 함)
+        offset = 0
+        while True:
+            logger.debug(f"📋 배치 조회 중: {offset + 1} ~ {offset + batch_size}")
+
+            # ids는 include 지정과 무관하게 항상 반환됨
+            batch_results = self.collection.get(limit=batch_size, offset=offset, include=["documents", "metadatas"])
+            if not batch_results["ids"]:
+                break
+            offset += len(batch_results["ids"])
+
+            yield [
+                {
+                    "id": doc_id,
+                    "content": content,
+                    "source": metadata.get("source", "unknown"),
+                    "metadata": metadata,
+                }
+                for doc_id, content, metadata in zip(
+                    batch_results["ids"], batch_results["documents"], batch_results["metadatas"]
+                )
+            ]
+
     async def get_all_documents(self) -> List[Dict[str, Any]]:
         """
         인덱스 재구축을 위한 모든 문서 조회
-        ChromaDB에서 모든 문서의 내용과 메타데이터를 가져옵니다.
+        전체 문서를 리스트로 메모리에 올리므로, 대용량 컬렉션에서는 iter_all_documents 사용을 권장합니다.
         """
         try:
-            logger.info(f"📄 모든 문서 조회 중... (총 {self.document_count}개)")
-
             if self.document_count == 0:
                 logger.warning("⚠️ 조회할 문서가 없습니다")
                 return []
 
-            # ChromaDB에서 모든 문서 조회
-            # 대용량 문서를 위해 배치 단위로 조회
-            batch_size = 1000  # 한 번에 조회할 문서 수
-            all_documents = []
-
-            # 전체 문서를 배치로 나누어 조회
-            for offset in range(0, self.document_count, batch_size):
-                try:
-                    # 현재 배치 크기 계산
-                    current_batch_size = min(batch_size, self.document_count - offset)
-
-                    logger.debug(f"📋 배치 조회 중: {offset + 1} ~ {offset + current_batch_size}")
+            logger.warning("⚠️ get_all_documents는 전체 문서를 메모리에 적재합니다. iter_all_documents 사용을 권장합니다")
 
-                    # ChromaDB에서 배치 조회
-                    batch_results = self.collection.get(
-                        limit=current_batch_size, offset=offset, include=["documents", "metadatas"]
-                    )
-
-                    # 결과 처리
-                    if batch_results["documents"]:
-                        for i, (content, metadata) in enumerate(
-                            zip(batch_results["documents"], batch_results["metadatas"])
-                        ):
-                            # 문서 데이터 구성 (ID는 자동 생성)
-                            document = {
-                                "id": f"doc_{offset + i}",  # 임시 ID 생성
-                                "content": content,
-                                "source": metadata.get("source", "unknown"),
-                                "metadata": metadata,
-                            }
-                            all_documents.append(document)
-
-                    logger.debug(f"✅ 배치 조회 완료: {len(batch_results['documents'])}개 문서")
-
-                except Exception as batch_error:
-                    logger.error(f"❌ 배치 조회 실패 (offset: {offset}): {str(batch_error)}")
-                    # 배치 실패 시에도 계속 진행
-                    continue
+            all_documents = []
+            async for batch in self.iter_all_documents():
+                all_documents.extend(batch)
 
             logger.info(f"✅ 모든 문서 조회 완료: {len(all_documents)}개 문서")
             return all_documents
@@ -314,6 +583,97 @@ class VectorStore:
             logger.error(f"❌ 모든 문서 조회 실패: {str(e)}")
             return []
 
+    async def reindex_in_place(self, batch_size: int = 1000) -> bool:
+        """
+        컬렉션 재색인
+        기존 문서를 배치 단위로 읽어 바로 임베딩 후 새 컬렉션에 추가하므로 메모리 사용량이 배치 크기로 제한됩니다.
+        현재 설정(임베딩 모델, 거리 공간, HNSW 파라미터)으로 인덱스를 새로 만든 뒤 기존 컬렉션과 교체합니다.
+        새 컬렉션의 문서 수가 기존 컬렉션과 다르면 교체하지 않고 임시 컬렉션을 남겨 둡니다.
+        같은 컬렉션을 사용하는 다른 VectorStore 인스턴스(예: LangChainRAGService.vector_store)는
+        교체 후 reload_collection()을 호출해야 하며, 그 전까지는 삭제된 컬렉션을 참조합니다.
+        """
+        collection_name = self.settings.COLLECTION_NAME
+        temp_name = f"{collection_name}_reindex"
+        old_name = f"{collection_name}_old"
+        try:
+            logger.info(f"🔄 컬렉션 재색인 시작: {self.document_count}개 문서")
+
+            # 이전 재색인이 중단되어 남은 임시 컬렉션 정리
+            try:
+                self.client.delete_collection(name=temp_name)
+            except Exception:
+                pass
+
+            new_collection = self.client.create_collection(name=temp_name, metadata=self._collection_metadata())
+            normalize = self.settings.VECTOR_DISTANCE_SPACE != "l2"
+            dim = self.embedding_model.get_sentence_embedding_dimension()
+
+            async for batch in self.iter_all_documents(batch_size):
+                contents = [doc["content"] or "" for doc in batch]
+                nonempty_indices = [i for i, content in enumerate(contents) if content]
+
+                embeddings = np.zeros((len(batch), dim), dtype=np.float32)
+                if nonempty_indices:
+                    embeddings[nonempty_indices] = self._encode_documents([contents[i] for i in nonempty_indices])
+                if normalize:
+                    embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+
+                new_collection.add(
+                    ids=[doc["id"] for doc in batch],
+                    documents=contents,
+                    metadatas=[doc["metadata"] for doc in batch],
+                    embeddings=embeddings,
+                )
+
+            # 복사 누락 검증 (다르면 기존 컬렉션을 유지하고 임시 컬렉션은 확인용으로 남김)
+            expected_count = self.collection.count()
+            copied_count = new_collection.count()
+            if copied_count != expected_count:
+                logger.error(
+                    f"❌ 컬렉션 재색인 중단: 문서 수 불일치 (기존 {expected_count}개, 새 컬렉션 {copied_count}개), "
+                    f"임시 컬렉션 유지: {temp_name}"
+                )
+                return False
+
+            # 기존 컬렉션을 옆으로 옮기고 새 컬렉션을 제자리로 옮긴 뒤 기존 컬렉션 삭제
+            try:
+                self.client.delete_collection(name=old_name)
+            except Exception:
+                pass
+            self.collection.modify(name=old_name)
+            try:
+                new_collection.modify(name=collection_name)
+            except Exception:
+                # 새 컬렉션 이름 변경 실패 시 기존 컬렉션 이름 복구
+                self.collection.modify(name=collection_name)
+                raise
+
+            self.collection = new_collection
+            self.distance_space = self.settings.VECTOR_DISTANCE_SPACE
+            self.document_count = self.collection.count()
+            self._source_counts = None
+
+            # 교체는 끝났으므로 기존 컬렉션 삭제 실패는 경고만 남김 (다음 재색인 시 정리)
+            try:
+                self.client.delete_collection(name=old_name)
+            except Exception as e:
+                logger.warning(f"⚠️ 이전 컬렉션 삭제 실패: {old_name} - {str(e)}")
+
+            logger.info(f"✅ 컬렉션 재색인 완료: {self.document_count}개 문서")
+            return True
+
+        except Exception as e:
+            logger.error(f"❌ 컬렉션 재색인 실패: {str(e)}")
+            return False
+
+    def reload_collection(self) -> None:
+        """다른 인스턴스가 컬렉션을 교체(재색인 등)한 뒤 현재 컬렉션을 다시 로드"""
+        self.collection = self.client.get_collection(name=self.settings.COLLECTION_NAME)
+        self.document_count = self.collection.count()
+        self.distance_space = (self.collection.metadata or {}).get("hnsw:space", "l2")
+        self._source_counts = None
+        logger.info(f"🔄 컬렉션 다시 로드: {self.settings.COLLECTION_NAME} ({self.document_count}개 문서)")
+
     async def get_documents_by_source(self, source: str) -> List[Dict[str, Any]]:
         """
         특정 소스의 문서들만 조회
@@ -327,10 +687,10 @@ class VectorStore:
 
             documents = []
             if results["documents"]:
-                for i, (content, metadata) in enumerate(zip(results["documents"], results["metadatas"])):
+                for doc_id, content, metadata in zip(results["ids"], results["documents"], results["metadatas"]):
                     documents.append(
                         {
-                            "id": f"source_{source}_{i}",  # 임시 ID 생성
+                            "id": doc_id,
                             "content": content,
                             "source": metadata.get("source", "unknown"),
                             "metadata": metadata,
@@ -350,20 +710,18 @@ class VectorStore:
         각 소스(파일)별로 몇 개의 문서가 있는지 조회
         """
         try:
-            logger.debug("📊 소스별 문서 개수 조회 중...")
+            if self._source_counts is None:
+                logger.debug("📊 소스별 문서 개수 집계 중...")
 
-            # 모든 메타데이터 조회
-            results = self.collection.get(include=["metadatas"])
+                # 최초 1회만 전체 메타데이터를 조회해 집계
+                results = self.collection.get(include=["metadatas"])
+                self._source_counts = Counter(
+                    (metadata or {}).get("source", "unknown") for metadata in results["metadatas"] or []
+                )
 
-            # 소스별 개수 계산
-            source_counts = {}
-            if results["metadatas"]:
-                for metadata in results["metadatas"]:
-                    source = metadata.get("source", "unknown")
-                    source_counts[source] = source_counts.get(source, 0) + 1
+                logger.debug(f"✅ 소스별 문서 개수 집계 완료: {len(self._source_counts)}개 소스")
 
-            logger.debug(f"✅ 소스별 문서 개수 조회 완료: {len(source_counts)}개 소스")
-            return source_counts
+            return dict(self._source_counts)
 
         except Exception as e:
             logger.error(f"❌ 소스별 문서 개수 조회 실패: {str(e)}")
@@ -371,25 +729,8 @@ class VectorStore:
 
     def _clean_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """ChromaDB 호환 메타데이터로 변환"""
-        clean_metadata = {}
-
-        for key, value in metadata.items():
-            # ChromaDB는 문자열과 숫자만 지원
-            if isinstance(value, (str, int, float, bool)):
-                clean_metadata[key] = value
-            elif isinstance(value, list):
-                # 리스트는 문자열로 변환
-                clean_metadata[key] = ", ".join(str(v) for v in value)
-            elif isinstance(value, dict):
-                # 딕셔너리는 JSON 문자열로 변환
-                import json
-
-                clean_metadata[key] = json.dumps(value, ensure_ascii=False)
-            else:
-                # 기타는 문자열로 변환
-                clean_metadata[key] = str(value)
-
-        return clean_metadata
+        converters = _METADATA_CONVERTERS
+        return {key: converters.get(type(value), _convert_metadata_value)(value) for key, value in metadata.items()}
 
     def get_document_count(self) -> int:
         """문서 개수 반환"""
@@ -398,6 +739,13 @@ class VectorStore:
     async def health_check(self) -> Dict[str, Any]:
         """벡터 스토어 상태 확인"""
         try:
+            # 로컬에서 증분 관리하는 문서 수를 실제 값으로 보정 (중복 ID 추가 등으로 어긋난 경우 소스별 통계도 재집계)
+            if self.collection is not None:
+                actual_count = self.collection.count()
+                if actual_count != self.document_count:
+                    self.document_count = actual_count
+                    self._source_counts = None
+
             # 기본 정보
             health_info = {
                 "status": "healthy",
@@ -409,7 +757,7 @@ class VectorStore:
 
             # 간단한 검색 테스트
             try:
-                test_results = await self.search_similar("테스트", top_k=1)
+                test_results = self._search_with_embedding(self._health_check_embedding, top_k=1)
                 health_info["search_functional"] = True
                 health_info["search_test_results"] = len(test_results)
             except Exception as e:
@@ -0,0 +1,4 @@
+"""
+머신러닝 런타임 패키지
+임베딩 모델 추론 백엔드 등 ML 런타임 관련 모듈들을 포함합니다.
+"""
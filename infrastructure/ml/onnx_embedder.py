@@ -0,0 +1,152 @@
+"""
+ONNX 임베딩 모델
+SentenceTransformer 모델을 ONNX로 내보내 ONNX Runtime으로 추론합니다.
+mean pooling을 사용하는 모델만 지원하며, 선택적으로 동적 int8 양자화를 적용합니다.
+"""
+
+import json
+import os
+from typing import List, Optional, Union
+
+import numpy as np
+import onnxruntime as ort
+from transformers import AutoTokenizer
+
+from core.logging.config import get_logger
+
+logger = get_logger(__name__)
+
+ONNX_OPSET_VERSION = 17
+DEFAULT_MAX_SEQ_LENGTH = 512
+
+
+def _load_sentence_transformer_config(model_name: str, filename: str) -> dict:
+    """Hugging Face Hub에서 sentence-transformers 설정 파일 로드 (없으면 빈 dict)"""
+    try:
+        from huggingface_hub import hf_hub_download
+
+        with open(hf_hub_download(model_name, filename), encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+class OnnxEmbedder:
+    """ONNX Runtime 기반 문장 임베딩 모델 (SentenceTransformer.encode 호환 인터페이스)"""
+
+    def __init__(self, model_name: str, export_dir: str, quantize: bool = False):
+        self.model_name = model_name
+        self.quantize = quantize
+
+        pooling_config = _load_sentence_transformer_config(model_name, "1_Pooling/config.json")
+        if pooling_config and not pooling_config.get("pooling_mode_mean_tokens", False):
+            raise ValueError(f"mean pooling 모델만 지원합니다: {model_name}")
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        st_config = _load_sentence_transformer_config(model_name, "sentence_bert_config.json")
+        self.max_seq_length = min(
+            st_config.get("max_seq_length", DEFAULT_MAX_SEQ_LENGTH),
+            self.tokenizer.model_max_length or DEFAULT_MAX_SEQ_LENGTH,
+        )
+
+        model_path = self._ensure_onnx_model(os.path.abspath(export_dir))
+
+        providers = [p for p in ("CUDAExecutionProvider", "CPUExecutionProvider") if p in ort.get_available_providers()]
+        session_options = ort.SessionOptions()
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(model_path, sess_options=session_options, providers=providers)
+        self._input_names = {i.name for i in self.session.get_inputs()}
+        self._dimension = self.session.get_outputs()[0].shape[-1]
+
+        logger.info(f"✅ ONNX 임베딩 세션 로드: {model_path} ({', '.join(self.session.get_providers())})")
+
+    def _ensure_onnx_model(self, export_dir: str) -> str:
+        """ONNX 모델 파일이 없으면 내보내기(및 양자화) 후 경로 반환"""
+        model_dir = os.path.join(export_dir, self.model_name.replace("/", "__"))
+        fp32_path = os.path.join(model_dir, "model.onnx")
+        int8_path = os.path.join(model_dir, "model_int8.onnx")
+
+        if not os.path.exists(fp32_path):
+            os.makedirs(model_dir, exist_ok=True)
+            self._export(fp32_path)
+
+        if not self.quantize:
+            return fp32_path
+
+        if not os.path.exists(int8_path):
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            logger.info("🔧 ONNX 모델 int8 동적 양자화 중...")
+            quantize_dynamic(model_input=fp32_path, model_output=int8_path, weight_type=QuantType.QInt8)
+
+        return int8_path
+
+    def _export(self, output_path: str) -> None:
+        """PyTorch 모델을 ONNX로 내보내기"""
+        import torch
+        from transformers import AutoModel
+
+        logger.info(f"🔧 ONNX 모델 내보내기 중: {self.model_name}")
+
+        model = AutoModel.from_pretrained(self.model_name)
+        model.config.return_dict = False
+        model.eval()
+
+        dummy = self.tokenizer(["ONNX 내보내기"], return_tensors="pt")
+        axes = {0: "batch", 1: "sequence"}
+        dynamic_axes = {"input_ids": axes, "attention_mask": axes, "last_hidden_state": axes}
+
+        with torch.inference_mode():
+            torch.onnx.export(
+                model,
+                (dummy["input_ids"], dummy["attention_mask"]),
+                output_path,
+                input_names=["input_ids", "attention_mask"],
+                output_names=["last_hidden_state"],
+                dynamic_axes=dynamic_axes,
+                opset_version=ONNX_OPSET_VERSION,
+            )
+
+        logger.info(f"✅ ONNX 모델 내보내기 완료: {output_path}")
+
+    def get_sentence_embedding_dimension(self) -> int:
+        """임베딩 차원 반환"""
+        return self._dimension
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        show_progress_bar: Optional[bool] = None,
+        normalize_embeddings: bool = False,
+    ) -> np.ndarray:
+        """문장 임베딩 생성 (단일 문자열이면 1차원 배열 반환)"""
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+
+        embeddings = np.empty((len(texts), self._dimension), dtype=np.float32)
+
+        # 길이순으로 정렬해 배치 내 패딩 최소화
+        order = np.argsort([-len(t) for t in texts], kind="stable")
+        for start in range(0, len(texts), batch_size):
+            batch_idx = order[start : start + batch_size]
+            encoded = self.tokenizer(
+                [texts[i] for i in batch_idx],
+                padding="longest",
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np",
+            )
+            feeds = {name: encoded[name].astype(np.int64) for name in self._input_names}
+            token_embeddings = self.session.run(None, feeds)[0]
+
+            # attention mask 기반 mean pooling
+            mask = encoded["attention_mask"][..., None].astype(np.float32)
+            summed = (token_embeddings * mask).sum(axis=1)
+            embeddings[batch_idx] = summed / np.clip(mask.sum(axis=1), 1e-9, None)
+
+        if normalize_embeddings:
+            embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+
+        return embeddings[0] if single else embeddings
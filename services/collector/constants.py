@@ -4,3 +4,19 @@ from enum import Enum
 class LawApiPath(str, Enum):
     law = "law"  # 법령
     prec = "prec"  # 판례
+
+
+# 법제처 API 동시 요청 설정
+LAW_API_MAX_CONCURRENCY = 8  # 동시 진행 요청 수
+LAW_API_MAX_CONNECTIONS = 32  # HTTP 커넥션 풀 최대 크기
+LAW_API_MAX_KEEPALIVE_CONNECTIONS = 16  # 유지할 keep-alive 커넥션 수
+LAW_API_TIMEOUT = 30.0  # 요청 타임아웃 (초)
+LAW_API_RATE_LIMIT_CALLS = 10  # 기간당 최대 호출 수
+LAW_API_RATE_LIMIT_PERIOD = 1.0  # 호출 제한 기간 (초)
+
+# 법제처 API 재시도 설정
+LAW_API_MAX_ATTEMPTS = 4  # 최대 시도 횟수 (최초 요청 포함)
+LAW_API_RETRY_INITIAL_WAIT = 0.2  # 첫 재시도 대기 시간 (초, 이후 지수 증가)
+LAW_API_RETRY_MAX_WAIT = 5.0  # 지수 백오프 최대 대기 시간 (초)
+LAW_API_RETRY_AFTER_MAX = 30.0  # Retry-After 헤더로 허용할 최대 대기 시간 (초)
+LAW_API_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})  # 재시도할 HTTP 상태 코드
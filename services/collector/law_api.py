@@ -1,12 +1,102 @@
 from core.config import get_settings
 from core.logging.config import get_logger
-import requests
+import httpx
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception_type,
+    retry_if_result,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 from typing import List, Dict, Any, Optional
-from services.collector.constants import LawApiPath
+from services.collector.constants import (
+    LawApiPath,
+    LAW_API_MAX_ATTEMPTS,
+    LAW_API_MAX_CONCURRENCY,
+    LAW_API_MAX_CONNECTIONS,
+    LAW_API_MAX_KEEPALIVE_CONNECTIONS,
+    LAW_API_RATE_LIMIT_CALLS,
+    LAW_API_RATE_LIMIT_PERIOD,
+    LAW_API_RETRY_AFTER_MAX,
+    LAW_API_RETRY_INITIAL_WAIT,
+    LAW_API_RETRY_MAX_WAIT,
+    LAW_API_RETRYABLE_STATUS_CODES,
+    LAW_API_TIMEOUT,
+)
+import asyncio
 import time
 
 logger = get_logger(__name__)
 
+# 법령 상세 응답에서 본문으로 사용할 필드 후보 (우선순위 순)
+LAW_CONTENT_KEYS = ("조문내용", "내용", "본문")
+
+_backoff_wait = wait_exponential_jitter(initial=LAW_API_RETRY_INITIAL_WAIT, max=LAW_API_RETRY_MAX_WAIT)
+
+
+def _is_retryable_response(response: httpx.Response) -> bool:
+    """일시적 오류(429/5xx) 응답인지 확인"""
+    return response.status_code in LAW_API_RETRYABLE_STATUS_CODES
+
+
+def _wait_with_retry_after(retry_state: RetryCallState) -> float:
+    """지수 백오프 대기 시간 (응답에 Retry-After 헤더가 있으면 그 이상 대기)"""
+    wait = _backoff_wait(retry_state)
+
+    if not retry_state.outcome.failed:
+        retry_after = retry_state.outcome.result().headers.get("Retry-After", "")
+        try:
+            wait = max(wait, min(float(retry_after), LAW_API_RETRY_AFTER_MAX))
+        except ValueError:
+            # HTTP-date 형식 등은 무시하고 백오프 사용
+            pass
+
+    return wait
+
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    """재시도 전 로그"""
+    outcome = retry_state.outcome
+    reason = str(outcome.exception()) if outcome.failed else f"HTTP {outcome.result().status_code}"
+    logger.warning(
+        f"🔄 법제처 API 재시도 ({retry_state.attempt_number}/{LAW_API_MAX_ATTEMPTS}) - "
+        f"{retry_state.next_action.sleep:.1f}초 후: {reason}"
+    )
+
+
+def _last_outcome(retry_state: RetryCallState) -> httpx.Response:
+    """재시도 소진 시 마지막 응답 반환 (마지막 시도가 예외였다면 그대로 전파)"""
+    return retry_state.outcome.result()
+
+
+class RateLimiter:
+    """
+    토큰 버킷 방식의 비동기 호출 제한기
+    period초 동안 최대 calls회까지 호출을 허용하고, 초과 시 토큰이 채워질 때까지 대기합니다.
+    """
+
+    def __init__(self, calls: int, period: float):
+        self.capacity = calls
+        self.refill_rate = calls / period
+        self.tokens = float(calls)
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """토큰 하나를 소비 (없으면 대기, 대기 중인 호출은 순서대로 처리)"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+                self.last_refill = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.refill_rate)
+
 
 class LawApi:
     """
@@ -15,16 +105,65 @@ class LawApi:
     """
     # TODO Task 구현 필요
 
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            http_client: 공유 HTTP 클라이언트 (없으면 자체 HTTP/2 클라이언트 생성, close()에서 종료)
+        """
         self.settings = get_settings()
-        self.base_url = "http://www.law.go.kr/DRF/lawSearch.do"
+        # HTTP/2는 TLS(ALPN)로만 협상되므로 HTTPS 사용
+        self.base_url = "https://www.law.go.kr/DRF/lawSearch.do"
         self.user_id = self.settings.LAW_API_USER_ID
         self.response_type = "JSON"
-        self.session = requests.Session()  # 세션 재사용으로 성능 향상
+
+        self._owns_client = http_client is None
+        self.client = http_client or httpx.AsyncClient(
+            http2=True,
+            timeout=LAW_API_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=LAW_API_MAX_KEEPALIVE_CONNECTIONS, max_connections=LAW_API_MAX_CONNECTIONS
+            ),
+        )
+        # 동시 요청 수 및 호출 빈도 제한
+        self._semaphore = asyncio.Semaphore(LAW_API_MAX_CONCURRENCY)
+        self.rate_limiter = RateLimiter(LAW_API_RATE_LIMIT_CALLS, LAW_API_RATE_LIMIT_PERIOD)
 
         logger.info(f"🏛️ 법제처 API 클라이언트 초기화 (사용자 ID: {self.user_id})")
 
-    def get_law_list(
+    async def close(self) -> None:
+        """자체 생성한 HTTP 클라이언트 종료"""
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def __aenter__(self) -> "LawApi":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @retry(
+        stop=stop_after_attempt(LAW_API_MAX_ATTEMPTS),
+        wait=_wait_with_retry_after,
+        retry=retry_if_exception_type(httpx.TransportError) | retry_if_result(_is_retryable_response),
+        before_sleep=_log_retry,
+        retry_error_callback=_last_outcome,
+    )
+    async def _send(self, params: Dict[str, Any]) -> httpx.Response:
+        """동시 요청 수와 호출 빈도를 제한하며 GET 요청 (네트워크 오류 및 429/5xx는 백오프 후 재시도)"""
+        async with self._semaphore:
+            await self.rate_limiter.acquire()
+            return await self.client.get(self.base_url, params=params, timeout=LAW_API_TIMEOUT)
+
+    async def _get(self, params: Dict[str, Any], raise_for_status: bool) -> Dict[str, Any]:
+        """GET 요청 후 JSON 반환"""
+        response = await self._send(params)
+
+        if raise_for_status:
+            response.raise_for_status()
+
+        return response.json()
+
+    async def get_law_list(
         self,
         search_keyword: str = "",
         page: int = 1,
@@ -61,12 +200,7 @@ class LawApi:
             if search_keyword.strip():
                 params["query"] = search_keyword.strip()
 
-            response = self.session.get(self.base_url, params=params, timeout=30)
-
-            if raise_for_status:
-                response.raise_for_status()
-
-            result = response.json()
+            result = await self._get(params, raise_for_status)
 
             # 응답 데이터 검증
             if "LawSearch" in result:
@@ -78,14 +212,14 @@ class LawApi:
 
             return result
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"❌ 법령 목록 조회 실패 - 네트워크 오류: {str(e)}")
             raise
         except Exception as e:
             logger.error(f"❌ 법령 목록 조회 실패 - 일반 오류: {str(e)}")
             raise
 
-    def get_law_detail(self, law_id: str, raise_for_status: bool = True) -> Dict[str, Any]:
+    async def get_law_detail(self, law_id: str, raise_for_status: bool = True) -> Dict[str, Any]:
         """
         특정 법령의 상세 내용 조회
 
@@ -106,24 +240,19 @@ class LawApi:
                 "ID": law_id,
             }
 
-            response = self.session.get(self.base_url, params=params, timeout=30)
-
-            if raise_for_status:
-                response.raise_for_status()
-
-            result = response.json()
+            result = await self._get(params, raise_for_status)
             logger.info(f"✅ 법령 상세 조회 성공 - ID: {law_id}")
 
             return result
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"❌ 법령 상세 조회 실패 - 네트워크 오류: {str(e)}")
             raise
         except Exception as e:
             logger.error(f"❌ 법령 상세 조회 실패 - 일반 오류: {str(e)}")
             raise
 
-    def search_laws_by_keywords(self, keywords: List[str], max_results: int = 50) -> List[Dict[str, Any]]:
+    async def search_laws_by_keywords(self, keywords: List[str], max_results: int = 50) -> List[Dict[str, Any]]:
         """
         키워드 목록으로 관련 법령 검색
 
@@ -137,53 +266,36 @@ class LawApi:
         try:
             logger.info(f"🔍 키워드 기반 법령 검색 - 키워드: {keywords}, 최대 결과: {max_results}")
 
-            all_laws = []
-            seen_law_ids = set()  # 중복 제거용
+            valid_keywords = [keyword for keyword in keywords if keyword.strip()]
 
-            for keyword in keywords:
-                if not keyword.strip():
-                    continue
+            # 키워드별 첫 페이지만 동시 조회 (추가 요청은 키워드당 1회로 제한)
+            first_pages = await asyncio.gather(
+                *(self._get_keyword_page(keyword, 1, min(20, max_results)) for keyword in valid_keywords)
+            )
 
-                logger.debug(f"🔎 키워드 검색 중: '{keyword}'")
+            all_laws = []
+            seen_law_ids = set()  # 중복 제거용
 
-                # 페이지별로 검색 (API 제한 고려)
+            # 키워드 순서대로 병합하며, 전체 결과가 부족할 때만 다음 페이지 순차 조회
+            for keyword, laws in zip(valid_keywords, first_pages):
                 page = 1
-                while len(all_laws) < max_results:
-                    try:
-                        result = self.get_law_list(
-                            search_keyword=keyword,
-                            page=page,
-                            display=min(20, max_results - len(all_laws)),
-                            raise_for_status=False,
-                        )
-
-                        # 응답 데이터 파싱
-                        if "LawSearch" not in result or "law" not in result["LawSearch"]:
-                            logger.debug(f"'{keyword}' 검색 결과 없음")
-                            break
-
-                        laws = result["LawSearch"]["law"]
-                        if not laws:
-                            break
-
-                        # 중복 제거하며 추가
-                        for law in laws:
-                            law_id = law.get("법령ID", "")
-                            if law_id and law_id not in seen_law_ids:
-                                seen_law_ids.add(law_id)
-                                law["검색키워드"] = keyword  # 어떤 키워드로 찾았는지 기록
-                                all_laws.append(law)
-
-                                if len(all_laws) >= max_results:
-                                    break
-
-                        page += 1
-                        time.sleep(0.1)  # API 호출 간격 조절
-
-                    except Exception as e:
-                        logger.warning(f"⚠️ 키워드 '{keyword}' 검색 중 오류: {str(e)}")
+                while laws:
+                    for law in laws:
+                        law_id = law.get("법령ID", "")
+                        if law_id and law_id not in seen_law_ids:
+                            seen_law_ids.add(law_id)
+                            law["검색키워드"] = keyword  # 어떤 키워드로 찾았는지 기록
+                            all_laws.append(law)
+
+                            if len(all_laws) >= max_results:
+                                break
+
+                    if len(all_laws) >= max_results:
                         break
 
+                    page += 1
+                    laws = await self._get_keyword_page(keyword, page, min(20, max_results - len(all_laws)))
+
                 if len(all_laws) >= max_results:
                     break
 
@@ -194,7 +306,41 @@ class LawApi:
             logger.error(f"❌ 키워드 기반 법령 검색 실패: {str(e)}")
             raise
 
-    def collect_law_documents(self, law_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def _get_keyword_page(self, keyword: str, page: int, display: int) -> List[Dict[str, Any]]:
+        """
+        단일 키워드의 검색 결과 한 페이지 조회
+
+        Args:
+            keyword: 검색 키워드
+            page: 페이지 번호
+            display: 페이지당 결과 수
+
+        Returns:
+            해당 페이지의 법령 목록 (결과가 없거나 오류 시 빈 목록)
+        """
+        if page == 1:
+            logger.debug(f"🔎 키워드 검색 중: '{keyword}'")
+
+        try:
+            result = await self.get_law_list(
+                search_keyword=keyword,
+                page=page,
+                display=display,
+                raise_for_status=False,
+            )
+
+            # 응답 데이터 파싱
+            if "LawSearch" not in result or "law" not in result["LawSearch"]:
+                logger.debug(f"'{keyword}' 검색 결과 없음")
+                return []
+
+            return result["LawSearch"]["law"] or []
+
+        except Exception as e:
+            logger.warning(f"⚠️ 키워드 '{keyword}' 검색 중 오류: {str(e)}")
+            return []
+
+    async def collect_law_documents(self, law_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         법령 목록에서 상세 문서 내용 수집
 
@@ -207,50 +353,13 @@ class LawApi:
         try:
             logger.info(f"📚 법령 문서 수집 시작 - 대상: {len(law_list)}개")
 
-            collected_docs = []
-
-            for i, law in enumerate(law_list, 1):
-                try:
-                    law_id = law.get("법령ID", "")
-                    law_name = law.get("법령명", "알 수 없음")
-
-                    if not law_id:
-                        logger.warning(f"⚠️ 법령 ID가 없습니다: {law_name}")
-                        continue
-
-                    logger.debug(f"📄 문서 수집 중 ({i}/{len(law_list)}): {law_name}")
-
-                    # 상세 내용 조회
-                    detail_result = self.get_law_detail(law_id, raise_for_status=False)
-
-                    # 문서 데이터 구성
-                    document = {
-                        "id": law_id,
-                        "title": law_name,
-                        "content": self._extract_law_content(detail_result),
-                        "source": f"법제처_API_{law_id}",
-                        "metadata": {
-                            "법령ID": law_id,
-                            "법령명": law_name,
-                            "검색키워드": law.get("검색키워드", ""),
-                            "수집일시": time.strftime("%Y-%m-%d %H:%M:%S"),
-                            "원본데이터": law,
-                        },
-                    }
-
-                    # 내용이 있는 경우만 추가
-                    if document["content"].strip():
-                        collected_docs.append(document)
-                        logger.debug(f"✅ 문서 수집 완료: {law_name} ({len(document['content'])}자)")
-                    else:
-                        logger.warning(f"⚠️ 내용이 비어있습니다: {law_name}")
-
-                    # API 호출 간격 조절
-                    time.sleep(0.2)
-
-                except Exception as e:
-                    logger.warning(f"⚠️ 개별 문서 수집 실패 ({law.get('법령명', 'Unknown')}): {str(e)}")
-                    continue
+            total = len(law_list)
+
+            # 상세 내용 조회를 동시 수행 (결과 순서는 입력 순서 유지)
+            results = await asyncio.gather(
+                *(self._collect_law_document(law, i, total) for i, law in enumerate(law_list, 1))
+            )
+            collected_docs = [document for document in results if document is not None]
 
             logger.info(f"✅ 법령 문서 수집 완료 - 성공: {len(collected_docs)}개")
             return collected_docs
@@ -259,6 +368,58 @@ class LawApi:
             logger.error(f"❌ 법령 문서 수집 실패: {str(e)}")
             raise
 
+    async def _collect_law_document(self, law: Dict[str, Any], index: int, total: int) -> Optional[Dict[str, Any]]:
+        """
+        단일 법령의 상세 문서 수집
+
+        Args:
+            law: 법령 목록 항목
+            index: 진행 상황 로깅용 순번
+            total: 전체 대상 수
+
+        Returns:
+            법령 문서 (ID나 내용이 없거나 실패 시 None)
+        """
+        try:
+            law_id = law.get("법령ID", "")
+            law_name = law.get("법령명", "알 수 없음")
+
+            if not law_id:
+                logger.warning(f"⚠️ 법령 ID가 없습니다: {law_name}")
+                return None
+
+            logger.debug(f"📄 문서 수집 중 ({index}/{total}): {law_name}")
+
+            # 상세 내용 조회
+            detail_result = await self.get_law_detail(law_id, raise_for_status=False)
+
+            # 문서 데이터 구성
+            document = {
+                "id": law_id,
+                "title": law_name,
+                "content": self._extract_law_content(detail_result),
+                "source": f"법제처_API_{law_id}",
+                "metadata": {
+                    "법령ID": law_id,
+                    "법령명": law_name,
+                    "검색키워드": law.get("검색키워드", ""),
+                    "수집일시": time.strftime("%Y-%m-%d %H:%M:%S"),
+                    "원본데이터": law,
+                },
+            }
+
+            # 내용이 있는 경우만 추가
+            if not document["content"].strip():
+                logger.warning(f"⚠️ 내용이 비어있습니다: {law_name}")
+                return None
+
+            logger.debug(f"✅ 문서 수집 완료: {law_name} ({len(document['content'])}자)")
+            return document
+
+        except Exception as e:
+            logger.warning(f"⚠️ 개별 문서 수집 실패 ({law.get('법령명', 'Unknown')}): {str(e)}")
+            return None
+
     def _extract_law_content(self, detail_data: Dict[str, Any]) -> str:
         """
         API 응답에서 법령 내용 추출
@@ -280,13 +441,10 @@ class LawApi:
                 if "법령명" in law_data:
                     content_parts.append(f"# {law_data['법령명']}")
 
-                # 법령 내용 추가 (실제 필드명은 API 문서 확인 필요)
-                if "조문내용" in law_data:
-                    content_parts.append(law_data["조문내용"])
-                elif "내용" in law_data:
-                    content_parts.append(law_data["내용"])
-                elif "본문" in law_data:
-                    content_parts.append(law_data["본문"])
+                # 법령 내용 추가 (후보 필드 중 처음 존재하는 것 사용, 실제 필드명은 API 문서 확인 필요)
+                content_key = next((key for key in LAW_CONTENT_KEYS if key in law_data), None)
+                if content_key is not None:
+                    content_parts.append(law_data[content_key])
 
                 # 기타 중요 정보 추가
                 if "제정개정" in law_data:
@@ -298,7 +456,7 @@ class LawApi:
             logger.warning(f"⚠️ 법령 내용 추출 실패: {str(e)}")
             return ""
 
-    def get_health_check(self) -> Dict[str, Any]:
+    async def get_health_check(self) -> Dict[str, Any]:
         """
         API 연결 상태 확인
 
@@ -309,7 +467,7 @@ class LawApi:
             logger.debug("🩺 법제처 API 상태 확인 중...")
 
             # 간단한 검색으로 API 상태 확인
-            result = self.get_law_list(search_keyword="", page=1, display=1, raise_for_status=False)
+            result = await self.get_law_list(search_keyword="", page=1, display=1, raise_for_status=False)
 
             if "LawSearch" in result:
                 return {
@@ -328,50 +486,53 @@ class LawApi:
 
 
 # 기존 호환성을 위한 별칭
-def get_law(raise_for_status=True):
+async def get_law(raise_for_status=True):
     """기존 get_law 함수 호환성 유지"""
-    api = LawApi()
-    return api.get_law_list(raise_for_status=raise_for_status)
+    async with LawApi() as api:
+        return await api.get_law_list(raise_for_status=raise_for_status)
 
 
 if __name__ == "__main__":
     """
     법제처 API 테스트 및 사용 예시
     """
-    print("🏛️ 법제처 API 테스트 시작...")
-
-    try:
-        # API 클라이언트 생성
-        law_api = LawApi()
-
-        # 1. API 상태 확인
-        print("\n1️⃣ API 상태 확인:")
-        health = law_api.get_health_check()
-        print(f"   상태: {health['status']}")
-        print(f"   메시지: {health['message']}")
 
-        # 2. 키워드 검색 테스트
-        print("\n2️⃣ 키워드 검색 테스트:")
-        keywords = ["근로기준법", "임대차"]
-        search_results = law_api.search_laws_by_keywords(keywords, max_results=5)
-        print(f"   검색 결과: {len(search_results)}개 법령")
+    async def main():
+        print("🏛️ 법제처 API 테스트 시작...")
 
-        for law in search_results[:3]:  # 상위 3개만 출력
-            print(f"   - {law.get('법령명', 'Unknown')} (키워드: {law.get('검색키워드', 'N/A')})")
-
-        # 3. 문서 수집 테스트
-        if search_results:
-            print("\n3️⃣ 문서 수집 테스트:")
-            documents = law_api.collect_law_documents(search_results[:2])  # 상위 2개만 수집
-            print(f"   수집된 문서: {len(documents)}개")
-
-            for doc in documents:
-                print(f"   - {doc['title']}: {len(doc['content'])}자")
+        try:
+            # API 클라이언트 생성
+            async with LawApi() as law_api:
+                # 1. API 상태 확인
+                print("\n1️⃣ API 상태 확인:")
+                health = await law_api.get_health_check()
+                print(f"   상태: {health['status']}")
+                print(f"   메시지: {health['message']}")
+
+                # 2. 키워드 검색 테스트
+                print("\n2️⃣ 키워드 검색 테스트:")
+                keywords = ["근로기준법", "임대차"]
+                search_results = await law_api.search_laws_by_keywords(keywords, max_results=5)
+                print(f"   검색 결과: {len(search_results)}개 법령")
+
+                for law in search_results[:3]:  # 상위 3개만 출력
+                    print(f"   - {law.get('법령명', 'Unknown')} (키워드: {law.get('검색키워드', 'N/A')})")
+
+                # 3. 문서 수집 테스트
+                if search_results:
+                    print("\n3️⃣ 문서 수집 테스트:")
+                    documents = await law_api.collect_law_documents(search_results[:2])  # 상위 2개만 수집
+                    print(f"   수집된 문서: {len(documents)}개")
+
+                    for doc in documents:
+                        print(f"   - {doc['title']}: {len(doc['content'])}자")
+
+            print("\n✅ 법제처 API 테스트 완료!")
 
-        print("\n✅ 법제처 API 테스트 완료!")
+        except Exception as e:
+            print(f"\n❌ 테스트 실패: {str(e)}")
+            import traceback
 
-    except Exception as e:
-        print(f"\n❌ 테스트 실패: {str(e)}")
-        import traceback
+            traceback.print_exc()
 
-        traceback.print_exc()
+    asyncio.run(main())
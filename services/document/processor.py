@@ -3,70 +3,267 @@
 텍스트 문서 로드, 청킹, 전처리를 담당합니다.
 """
 
+import asyncio
+import multiprocessing
 import os
-import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, AsyncIterator, Iterator, Optional, Tuple
 from datetime import datetime
 
 from core.config import get_settings
 from core.logging.config import get_logger
+from infrastructure.database.chunk_cache import ChunkCache
 
 logger = get_logger(__name__)
 
+# 동시에 처리할 최대 파일 수 (디스크 경합 방지를 위해 CPU 코어 수 이내로 제한)
+MAX_CONCURRENT_FILES = min(32, os.cpu_count() or 4)
+
+# 회전형 디스크(HDD)에서는 동시 읽기가 탐색(seek) 경합만 늘리므로 순차 처리
+ROTATIONAL_DISK_CONCURRENT_FILES = 1
+
+# 지원 파일 확장자 (소문자)
+SUPPORTED_EXTENSIONS = frozenset({".txt", ".md"})
+
+# 이 길이(문자 수) 이상인 문서만 프로세스 풀에서 청킹 (작은 문서는 프로세스 간 전송 비용이 더 큼)
+PROCESS_POOL_MIN_CHARS = 100_000
+
+# 청킹용 프로세스 풀 최대 워커 수 (웹 서버 워커와 코어를 나눠 쓰므로 작게 유지)
+PROCESS_POOL_MAX_WORKERS = 4
+
+# 청크 경계로 사용할 문장 종결 부호
+SENTENCE_DELIMITERS = (".", "!", "?")
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """청킹용 프로세스 풀 (처음 필요할 때 생성)"""
+    global _process_pool
+    if _process_pool is None:
+        # 이벤트 루프와 스레드가 떠 있는 서버 프로세스를 fork하지 않도록 spawn 사용
+        _process_pool = ProcessPoolExecutor(
+            max_workers=min(PROCESS_POOL_MAX_WORKERS, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """청킹용 프로세스 풀 종료 (애플리케이션 종료 시 호출, 이벤트 루프를 막지 않도록 워커 종료를 기다리지 않음)"""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+def _detect_read_concurrency(path: str) -> int:
+    """경로가 위치한 블록 장치가 HDD이면 순차 처리, 그 외(SSD, 판별 불가)에는 기본 동시성 반환 (Linux 전용 판별)"""
+    try:
+        st_dev = os.stat(path).st_dev
+        device_dir = os.path.realpath(f"/sys/dev/block/{os.major(st_dev)}:{os.minor(st_dev)}")
+        # 파티션은 상위 디스크 디렉토리에 queue 정보가 있음
+        for candidate in (device_dir, os.path.dirname(device_dir)):
+            rotational_path = os.path.join(candidate, "queue", "rotational")
+            if os.path.exists(rotational_path):
+                with open(rotational_path) as f:
+                    if f.read().strip() == "1":
+                        return ROTATIONAL_DISK_CONCURRENT_FILES
+                break
+    except (OSError, ValueError):
+        pass
+    return MAX_CONCURRENT_FILES
+
+
+def _read_bytes(file_path: str) -> bytes:
+    """파일 전체를 바이트로 읽기 (크기를 알고 한 번에 읽으므로 디코딩 재시도 시 다시 읽을 필요 없음)"""
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
+def preprocess_text(text: str) -> str:
+    """텍스트 전처리 (간소화)"""
+    # 이미 정규화된 텍스트는 그대로 반환 (공백 외의 공백 문자는 모두 isprintable()이 False)
+    if text.isprintable() and "  " not in text and text[:1] != " " and text[-1:] != " ":
+        return text
+
+    # 줄바꿈을 포함한 연속 공백을 하나의 공백으로 (앞뒤 공백 제거 포함)
+    return " ".join(text.split())
+
+
+def iter_text_chunks(cleaned_content: str, chunk_size: int, chunk_overlap: int) -> Iterator[str]:
+    """전처리된 텍스트를 슬라이딩 윈도우 방식으로 잘라 청크 본문을 하나씩 생성"""
+    text_length = len(cleaned_content)
+    start = 0
+
+    while start < text_length:
+        end = min(start + chunk_size, text_length)
+
+        # 문장 경계에서 자르기 시도
+        if end < text_length:
+            lo = max(start + chunk_size // 2, start + 100)
+            # 전처리 후에는 줄바꿈이 남지 않으므로 문장 부호만 탐색
+            boundary = max(cleaned_content.rfind(ch, lo, end) for ch in SENTENCE_DELIMITERS)
+            if boundary >= lo:
+                end = boundary + 1
+
+        chunk_content = cleaned_content[start:end].strip()
+
+        if chunk_content and len(chunk_content) > 20:  # 너무 짧은 청크 제외
+            yield chunk_content
+
+        # 다음 청크 시작점 (오버랩 고려, 문장 경계로 청크가 짧아져도 항상 앞으로 진행)
+        start = max(end - chunk_overlap, start + 1)
+
+        if start >= text_length - chunk_overlap:
+            break
+
+
+def create_chunks(content: str, metadata: Dict[str, Any], chunk_size: int, chunk_overlap: int) -> List[Dict[str, Any]]:
+    """
+    텍스트 청킹 (간소화)
+    프로세스 풀에서 실행될 수 있으므로 상태나 로깅 없이 순수 함수로 유지합니다.
+    """
+    # 텍스트 전처리
+    cleaned_content = preprocess_text(content)
+
+    if not cleaned_content or len(cleaned_content) < 50:
+        return []
+
+    # 문서가 청크 크기보다 작으면 전체를 하나의 청크로
+    if len(cleaned_content) <= chunk_size:
+        return [
+            {
+                "content": cleaned_content,
+                "source": metadata.get("file_name", "unknown"),
+                "metadata": {**metadata, "chunk_id": 0, "total_chunks": 1},
+            }
+        ]
+
+    # 청크 본문을 먼저 모아 총 청크 수를 알고 나서 메타데이터를 한 번에 구성
+    contents = list(iter_text_chunks(cleaned_content, chunk_size, chunk_overlap))
+    total_chunks = len(contents)
+    source = metadata.get("file_name", "unknown")
+
+    return [
+        {
+            "content": chunk_content,
+            "source": source,
+            "metadata": {
+                **metadata,
+                "chunk_id": chunk_id,
+                "chunk_length": len(chunk_content),
+                "total_chunks": total_chunks,
+            },
+        }
+        for chunk_id, chunk_content in enumerate(contents)
+    ]
+
 
 class DocumentProcessor:
     """간소화된 문서 처리 서비스"""
 
     def __init__(self):
         self.settings = get_settings()
-        self.processed_chunks = []
 
         # 청킹 설정
         self.chunk_size = self.settings.CHUNK_SIZE
         self.chunk_overlap = self.settings.CHUNK_OVERLAP
 
         # 지원 파일 형식 (텍스트만)
-        self.supported_extensions = {".txt", ".md"}
+        self.supported_extensions = SUPPORTED_EXTENSIONS
 
-    async def process_documents(self, data_path: Optional[str] = None) -> bool:
-        """문서 처리"""
-        try:
-            source_path = data_path or self.settings.DATA_PATH
-            logger.info(f"📄 문서 처리 시작: {source_path}")
+        # 파일별 청킹 결과 캐시
+        self.chunk_cache: Optional[ChunkCache] = None
+        self._initialize_chunk_cache()
 
-            if not os.path.exists(source_path):
-                logger.warning(f"⚠️ 데이터 경로가 존재하지 않습니다: {source_path}")
-                return await self._create_sample_documents()
+        # 마지막 iter_chunks 실행의 누적 통계 (청크 생성 시점에 갱신)
+        self._source_counts: Counter = Counter()
+        self._category_counts: Counter = Counter()
+        self._total_chunks = 0
+        self._total_content_length = 0
 
-            # 문서 파일 수집
-            document_files = self._collect_document_files(source_path)
+    def _initialize_chunk_cache(self):
+        """청크 캐시 초기화 (실패해도 캐시 없이 동작)"""
+        try:
+            self.chunk_cache = ChunkCache(self.settings.CHUNK_CACHE_PATH)
+        except Exception as e:
+            logger.warning(f"⚠️ 청크 캐시 초기화 실패, 캐시 없이 진행: {str(e)}")
+            self.chunk_cache = None
+
+    async def iter_chunks(
+        self, data_path: Optional[str] = None, batch_size: int = 256
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        문서 청크를 배치 단위로 생성
+        파일별로 청킹한 결과를 batch_size개씩 모아 전달하므로 전체 청크를 메모리에 올리지 않습니다.
+        """
+        source_path = data_path or self.settings.DATA_PATH
+        logger.info(f"📄 문서 처리 시작: {source_path}")
+        self._reset_statistics()
+
+        if not os.path.exists(source_path):
+            logger.warning(f"⚠️ 데이터 경로가 존재하지 않습니다: {source_path}")
+            yield self._record_statistics(self._create_sample_documents())
+            return
+
+        # 문서 파일 수집
+        document_files = self._collect_document_files(source_path)
+
+        if not document_files:
+            logger.warning("⚠️ 처리할 문서 파일이 없습니다. 샘플 문서를 생성합니다.")
+            yield self._record_statistics(self._create_sample_documents())
+            return
+
+        # 문서 처리 (처리 시각은 실행 단위로 한 번만 기록해 모든 청크가 같은 문자열을 공유)
+        processed_at = datetime.now().isoformat()
+        pending_chunks = []
+        total_processed = 0
+
+        # 파일을 저장 장치에 맞는 개수씩 묶어 동시에 처리 (한 번에 메모리에 올라가는 청크는 한 묶음 분량)
+        read_concurrency = _detect_read_concurrency(source_path)
+        logger.debug(f"📁 파일 동시 처리 수: {read_concurrency}")
+        for start in range(0, len(document_files), read_concurrency):
+            file_group = document_files[start : start + read_concurrency]
+            results = await asyncio.gather(
+                *(self._process_single_file(file_path, processed_at) for file_path in file_group),
+                return_exceptions=True,
+            )
+
+            for file_path, chunks in zip(file_group, results):
+                if isinstance(chunks, BaseException):
+                    logger.error(f"❌ 파일 처리 실패: {file_path} - {str(chunks)}")
+                    continue
 
-            if not document_files:
-                logger.warning("⚠️ 처리할 문서 파일이 없습니다. 샘플 문서를 생성합니다.")
-                return await self._create_sample_documents()
+                pending_chunks.extend(self._record_statistics(chunks))
+                total_processed += len(chunks)
+                logger.debug(f"✅ 파일 처리 완료: {file_path} ({len(chunks)}개 청크)")
 
-            # 문서 처리
-            self.processed_chunks = []
-            total_processed = 0
+            while len(pending_chunks) >= batch_size:
+                yield pending_chunks[:batch_size]
+                pending_chunks = pending_chunks[batch_size:]
 
-            for file_path in document_files:
-                try:
-                    chunks = await self._process_single_file(file_path)
-                    self.processed_chunks.extend(chunks)
-                    total_processed += len(chunks)
-                    logger.debug(f"✅ 파일 처리 완료: {file_path} ({len(chunks)}개 청크)")
+        if pending_chunks:
+            yield pending_chunks
 
-                except Exception as e:
-                    logger.error(f"❌ 파일 처리 실패: {file_path} - {str(e)}")
-                    continue
+        logger.info(f"✅ 문서 처리 완료: {len(document_files)}개 파일, {total_processed}개 청크")
 
-            logger.info(f"✅ 문서 처리 완료: {len(document_files)}개 파일, {total_processed}개 청크")
-            return True
+    def _reset_statistics(self):
+        """누적 통계 초기화"""
+        self._source_counts.clear()
+        self._category_counts.clear()
+        self._total_chunks = 0
+        self._total_content_length = 0
 
-        except Exception as e:
-            logger.error(f"❌ 문서 처리 실패: {str(e)}")
-            return False
+    def _record_statistics(self, chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """생성된 청크를 누적 통계에 반영하고 그대로 반환"""
+        self._source_counts.update(chunk.get("source", "unknown") for chunk in chunks)
+        self._category_counts.update(chunk.get("metadata", {}).get("category", "unknown") for chunk in chunks)
+        self._total_chunks += len(chunks)
+        self._total_content_length += sum(len(chunk.get("content", "")) for chunk in chunks)
+        return chunks
 
     def _collect_document_files(self, data_path: str) -> List[str]:
         """문서 파일 수집 (텍스트 파일만)"""
@@ -80,9 +277,7 @@ class DocumentProcessor:
                     document_files.append(str(data_dir))
             else:
                 # 디렉토리인 경우 재귀적으로 탐색
-                for file_path in data_dir.rglob("*"):
-                    if file_path.is_file() and file_path.suffix.lower() in self.supported_extensions:
-                        document_files.append(str(file_path))
+                document_files.extend(self._walk_document_files(str(data_dir)))
 
             logger.debug(f"📁 수집된 문서 파일: {len(document_files)}개")
             return document_files
@@ -91,13 +286,52 @@ class DocumentProcessor:
             logger.error(f"❌ 문서 파일 수집 실패: {str(e)}")
             return []
 
-    async def _process_single_file(self, file_path: str) -> List[Dict[str, Any]]:
+    def _walk_document_files(self, root: str) -> Iterator[str]:
+        """os.scandir로 디렉토리를 재귀 탐색하며 지원 확장자 파일 경로 생성 (dirent 정보로 추가 stat 호출 없음)"""
+        stack = [root]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        name = entry.name
+                        dot = name.rfind(".")
+                        if dot > 0 and name[dot:].lower() in self.supported_extensions:
+                            yield entry.path
+
+    def _get_cached_chunks(
+        self, file_path: str
+    ) -> Tuple[Tuple[str, int, int, int, int], Optional[List[Dict[str, Any]]]]:
+        """파일 상태로 캐시 키를 만들고 캐시된 청크 조회 (블로킹 I/O이므로 스레드에서 호출)"""
+        stat = os.stat(file_path)
+        cache_key = (
+            os.path.abspath(file_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            self.chunk_size,
+            self.chunk_overlap,
+        )
+        return cache_key, self.chunk_cache.get(*cache_key)
+
+    async def _process_single_file(self, file_path: str, processed_at: str) -> List[Dict[str, Any]]:
         """단일 파일 처리 (간소화)"""
         try:
             file_path_obj = Path(file_path)
 
             logger.debug(f"📄 파일 처리 중: {file_path}")
 
+            # 변경되지 않은 파일이면 캐시된 청크 사용 (stat과 SQLite 조회는 스레드에서 수행)
+            cache_key = None
+            if self.chunk_cache is not None:
+                cache_key, cached_chunks = await asyncio.to_thread(self._get_cached_chunks, file_path)
+                if cached_chunks is not None:
+                    # 캐시에 저장된 처리 시각 대신 이번 실행의 처리 시각으로 갱신
+                    for chunk in cached_chunks:
+                        chunk["metadata"]["processed_at"] = processed_at
+                    logger.debug(f"✅ 청크 캐시 사용: {file_path} ({len(cached_chunks)}개 청크)")
+                    return cached_chunks
+
             # 파일 내용 읽기
             content = await self._read_text_file(file_path)
 
@@ -109,11 +343,14 @@ class DocumentProcessor:
             metadata = {
                 "file_path": file_path,
                 "file_name": file_path_obj.name,
-                "processed_at": datetime.now().isoformat(),
+                "processed_at": processed_at,
             }
 
             # 텍스트 청킹
-            chunks = self._create_chunks(content, metadata)
+            chunks = await self._chunk_content(content, metadata)
+
+            if cache_key is not None:
+                await asyncio.to_thread(self.chunk_cache.put, *cache_key, chunks)
 
             return chunks
 
@@ -124,120 +361,47 @@ class DocumentProcessor:
     async def _read_text_file(self, file_path: str) -> str:
         """텍스트 파일 읽기"""
         try:
-            # UTF-8 인코딩으로 읽기
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            logger.debug(f"✅ 파일 읽기 성공: {file_path}")
-            return content
-
-        except UnicodeDecodeError:
-            # CP949 인코딩으로 재시도
-            try:
-                with open(file_path, "r", encoding="cp949") as f:
-                    content = f.read()
-                logger.debug(f"✅ 파일 읽기 성공 (CP949): {file_path}")
-                return content
-            except Exception as e:
-                logger.error(f"❌ 파일 읽기 실패: {file_path} - {str(e)}")
-                return ""
-
+            # 블로킹 I/O는 스레드에서 수행
+            data = await asyncio.to_thread(_read_bytes, file_path)
         except Exception as e:
             logger.error(f"❌ 텍스트 파일 읽기 실패: {file_path} - {str(e)}")
             return ""
 
-    def _create_chunks(self, content: str, metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """텍스트 청킹 (간소화)"""
         try:
-            # 텍스트 전처리
-            cleaned_content = self._preprocess_text(content)
-
-            if not cleaned_content or len(cleaned_content) < 50:
-                logger.warning("⚠️ 텍스트가 너무 짧아 청킹하지 않습니다")
-                return []
-
-            # 청킹 수행
-            chunks = []
-            text_length = len(cleaned_content)
+            # UTF-8로 디코딩 (BOM이 있으면 제거)
+            content = data.decode("utf-8-sig")
+            logger.debug(f"✅ 파일 읽기 성공: {file_path}")
+            return content
 
-            # 문서가 청크 크기보다 작으면 전체를 하나의 청크로
-            if text_length <= self.chunk_size:
-                chunks.append(
-                    {
-                        "content": cleaned_content,
-                        "source": metadata.get("file_name", "unknown"),
-                        "metadata": {**metadata, "chunk_id": 0, "total_chunks": 1},
-                    }
-                )
-            else:
-                # 슬라이딩 윈도우 방식으로 청킹
-                chunk_id = 0
-                start = 0
-
-                while start < text_length:
-                    end = min(start + self.chunk_size, text_length)
-
-                    # 문장 경계에서 자르기 시도
-                    if end < text_length:
-                        for i in range(end, max(start + self.chunk_size // 2, start + 100), -1):
-                            if cleaned_content[i - 1] in ".!?\n":
-                                end = i
-                                break
-
-                    chunk_content = cleaned_content[start:end].strip()
-
-                    if chunk_content and len(chunk_content) > 20:  # 너무 짧은 청크 제외
-                        chunks.append(
-                            {
-                                "content": chunk_content,
-                                "source": metadata.get("file_name", "unknown"),
-                                "metadata": {**metadata, "chunk_id": chunk_id, "chunk_length": len(chunk_content)},
-                            }
-                        )
-                        chunk_id += 1
-
-                    # 다음 청크 시작점 (오버랩 고려)
-                    start = end - self.chunk_overlap
-
-                    if start >= text_length - self.chunk_overlap:
-                        break
-
-                # 총 청크 수 메타데이터 업데이트
-                for chunk in chunks:
-                    chunk["metadata"]["total_chunks"] = len(chunks)
+        except UnicodeDecodeError:
+            # 이미 읽은 바이트를 CP949로 디코딩 (깨진 바이트는 대체 문자로)
+            content = data.decode("cp949", errors="replace")
+            logger.debug(f"✅ 파일 읽기 성공 (CP949): {file_path}")
+            return content
 
+    async def _chunk_content(self, content: str, metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """텍스트 청킹 (큰 문서는 프로세스 풀에서 수행해 여러 코어 활용)"""
+        if len(content) >= PROCESS_POOL_MIN_CHARS:
+            loop = asyncio.get_running_loop()
+            chunks = await loop.run_in_executor(
+                _get_process_pool(), create_chunks, content, metadata, self.chunk_size, self.chunk_overlap
+            )
+        else:
+            chunks = create_chunks(content, metadata, self.chunk_size, self.chunk_overlap)
+
+        if not chunks:
+            logger.warning("⚠️ 텍스트가 너무 짧아 청킹하지 않습니다")
+        else:
             logger.debug(f"✅ 청킹 완료: {len(chunks)}개 청크")
-            return chunks
+        return chunks
 
-        except Exception as e:
-            logger.error(f"❌ 청킹 실패: {str(e)}")
-            return []
-
-    def _preprocess_text(self, text: str) -> str:
-        """텍스트 전처리 (간소화)"""
-        try:
-            # 기본 정리
-            text = text.strip()
-
-            # 여러 공백을 하나로
-            text = re.sub(r"\s+", " ", text)
-
-            # 여러 줄바꿈을 최대 2개로
-            text = re.sub(r"\n{3,}", "\n\n", text)
-
-            return text.strip()
-
-        except Exception as e:
-            logger.error(f"❌ 텍스트 전처리 실패: {str(e)}")
-            return text
-
-    async def _create_sample_documents(self) -> bool:
+    def _create_sample_documents(self) -> List[Dict[str, Any]]:
         """샘플 문서 생성 (간소화)"""
-        try:
-            logger.info("📝 샘플 문서 생성 중...")
+        logger.info("📝 샘플 문서 생성 중...")
 
-            sample_documents = [
-                {
-                    "content": """주택임대차보호법에 따른 보증금 반환 절차
+        sample_documents = [
+            {
+                "content": """주택임대차보호법에 따른 보증금 반환 절차
 
 1. 내용증명 발송: 임대인에게 보증금 반환을 요구하는 내용증명을 발송합니다.
 2. 임차권등기명령 신청: 주택임대차보호법에 따라 임차권등기명령을 신청할 수 있습니다.
@@ -245,11 +409,11 @@ class DocumentProcessor:
 4. 강제집행: 승소 판결을 받은 후 강제집행을 통해 보증금을 회수할 수 있습니다.
 
 주택도시보증공사의 전세보증금반환보증 등을 통해 보증금을 보호받을 수 있습니다.""",
-                    "source": "주택임대차보호법",
-                    "metadata": {"category": "부동산", "type": "법률조항"},
-                },
-                {
-                    "content": """근로기준법에 따른 부당해고 구제 절차
+                "source": "주택임대차보호법",
+                "metadata": {"category": "부동산", "type": "법률조항"},
+            },
+            {
+                "content": """근로기준법에 따른 부당해고 구제 절차
 
 1. 노동위원회 신청: 해고일로부터 3개월 이내에 노동위원회에 부당해고 구제신청을 해야 합니다.
 2. 조사 및 심문: 노동위원회에서 사실관계를 조사하고 당사자를 심문합니다.
@@ -257,54 +421,31 @@ class DocumentProcessor:
 4. 이행강제금: 구제명령을 이행하지 않으면 이행강제금이 부과됩니다.
 
 해고는 정당한 이유가 있어야 하며, 해고절차를 준수해야 합니다.""",
-                    "source": "근로기준법",
-                    "metadata": {"category": "근로", "type": "법률조항"},
-                },
-            ]
-
-            self.processed_chunks = sample_documents
-            logger.info(f"✅ 샘플 문서 생성 완료: {len(sample_documents)}개")
-            return True
-
-        except Exception as e:
-            logger.error(f"❌ 샘플 문서 생성 실패: {str(e)}")
-            return False
+                "source": "근로기준법",
+                "metadata": {"category": "근로", "type": "법률조항"},
+            },
+        ]
 
-    def get_processed_chunks(self) -> List[Dict[str, Any]]:
-        """처리된 문서 청크 반환"""
-        return self.processed_chunks
+        logger.info(f"✅ 샘플 문서 생성 완료: {len(sample_documents)}개")
+        return sample_documents
 
     async def get_processing_statistics(self) -> Dict[str, Any]:
-        """문서 처리 통계"""
+        """문서 처리 통계 (마지막 iter_chunks 실행 기준, 청크 생성 중 누적한 값 사용)"""
         try:
             stats = {
-                "total_chunks": len(self.processed_chunks),
+                "total_chunks": self._total_chunks,
                 "chunk_size": self.chunk_size,
                 "chunk_overlap": self.chunk_overlap,
-                "supported_extensions": list(self.supported_extensions),
+                "supported_extensions": sorted(self.supported_extensions),
             }
 
-            if self.processed_chunks:
-                # 소스별 통계
-                sources = {}
-                categories = {}
-                total_content_length = 0
-
-                for chunk in self.processed_chunks:
-                    source = chunk.get("source", "unknown")
-                    category = chunk.get("metadata", {}).get("category", "unknown")
-                    content_length = len(chunk.get("content", ""))
-
-                    sources[source] = sources.get(source, 0) + 1
-                    categories[category] = categories.get(category, 0) + 1
-                    total_content_length += content_length
-
+            if self._total_chunks:
                 stats.update(
                     {
-                        "sources": sources,
-                        "categories": categories,
-                        "avg_chunk_length": total_content_length / len(self.processed_chunks),
-                        "total_content_length": total_content_length,
+                        "sources": dict(self._source_counts),
+                        "categories": dict(self._category_counts),
+                        "avg_chunk_length": self._total_content_length / self._total_chunks,
+                        "total_content_length": self._total_content_length,
                     }
                 )
 
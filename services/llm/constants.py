@@ -11,3 +11,15 @@ CATEGORY_KEYWORDS = {
     "가족": ["결혼", "이혼", "자녀", "양육", "상속", "위자료"],
     "형사": ["고발", "신고", "경찰", "검찰", "범죄"],
 }
+
+# 분류로 만든 검색 키워드 중 이 비율 이상이 원 질문에 그대로 포함되면 원 질문으로 미리 수행한 검색 결과를 재사용
+SPECULATIVE_SEARCH_REUSE_RATIO = 0.8
+
+# 질문 분류 결과 캐시 최대 항목 수 (LRU)
+CLASSIFICATION_CACHE_SIZE = 1024
+
+# 분류 응답 파싱 실패 시 기본값에 기록하는 사유 (캐시 대상에서 제외하는 데 사용)
+CLASSIFICATION_PARSE_FAILURE_REASON = "파싱 실패로 기본값 사용"
+
+# 법률 관련 질문으로 분류되었더라도 분류 신뢰도가 이보다 낮으면 문서 검색 생략
+MIN_CLASSIFICATION_CONFIDENCE_FOR_SEARCH = 0.3
@@ -5,14 +5,20 @@ LangChain Memory를 사용하여 대화 맥락을 자동 관리합니다.
 """
 
 import os
-from typing import List, Dict, Any, Optional
-import json
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, AsyncIterator, ClassVar, Optional, Union
 import asyncio
 
+import httpx
+import orjson
+from pydantic import PrivateAttr
 from langchain_openai import ChatOpenAI
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
 from langchain_core.output_parsers import StrOutputParser, BaseOutputParser
+from langchain_core.messages import SystemMessage
 from langchain_community.callbacks import get_openai_callback
 from langchain.memory import ConversationBufferWindowMemory
 
@@ -25,6 +31,17 @@ from services.llm.constants import *
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _read_prompt_file(secret_path: str, prompt_file_name: str) -> str:
+    """프롬프트 파일 읽기 (프로세스당 파일별로 한 번만 읽음, 없으면 빈 문자열)"""
+    file_path = os.path.join(secret_path, prompt_file_name)
+    prompt_text = ""
+    if os.path.isfile(file_path):
+        with open(file_path, "r", encoding="utf-8") as f:
+            prompt_text = f.read()
+    return prompt_text
+
+
 class QueryClassificationParser(BaseOutputParser[Dict[str, Any]]):
     """질문 분류 결과 파서"""
 
@@ -43,7 +60,7 @@ class QueryClassificationParser(BaseOutputParser[Dict[str, Any]]):
             else:
                 json_text = text
 
-            result = json.loads(json_text)
+            result = orjson.loads(json_text)
 
             # 필수 필드 검증
             return {
@@ -66,15 +83,48 @@ class QueryClassificationParser(BaseOutputParser[Dict[str, Any]]):
                 "main_topic": "",
                 "key_entities": [],
                 "search_keywords": [],
-                "reasoning": "파싱 실패로 기본값 사용",
+                "reasoning": CLASSIFICATION_PARSE_FAILURE_REASON,
             }
 
 
+class CachedWindowMemory(ConversationBufferWindowMemory):
+    """프롬프트용 최근 대화 기록 문자열을 캐시하는 대화 윈도우 메모리 (대화 저장/초기화 시에만 다시 생성)"""
+
+    # 프롬프트에 포함할 최근 메시지 수 (최근 3턴)
+    RECENT_MESSAGE_COUNT: ClassVar[int] = 6
+
+    _rendered_history: Optional[str] = PrivateAttr(default=None)
+
+    def save_context(self, inputs: Dict[str, Any], outputs: Dict[str, str]) -> None:
+        super().save_context(inputs, outputs)
+        self._rendered_history = None
+
+    def clear(self) -> None:
+        super().clear()
+        self._rendered_history = None
+
+    def render_recent(self) -> str:
+        """최근 대화 기록을 "역할: 내용" 줄 단위 문자열로 반환"""
+        if self._rendered_history is None:
+            lines = []
+            for msg in self.chat_memory.messages[-self.RECENT_MESSAGE_COUNT :]:
+                if hasattr(msg, "content"):
+                    role = "사용자" if msg.__class__.__name__ == "HumanMessage" else "Law Mate"
+                    lines.append(f"{role}: {msg.content}")
+            self._rendered_history = "\n".join(lines).strip()
+        return self._rendered_history
+
+
 class LangChainRAGService:
     """완전한 LangChain 기반 RAG 서비스 (Memory 통합)"""
 
-    def __init__(self):
-        """LangChain RAG 서비스 초기화"""
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        LangChain RAG 서비스 초기화
+
+        Args:
+            http_client: ChatOpenAI 비동기 호출에 재사용할 공유 HTTP 클라이언트
+        """
         self.settings = get_settings()
 
         # ChatOpenAI 초기화
@@ -85,6 +135,7 @@ class LangChainRAGService:
                 temperature=self.settings.TEMPERATURE,
                 max_tokens=1500,
                 streaming=False,
+                http_async_client=http_client,
             )
             self.answer_llm = ChatOpenAI(
                 api_key=self.settings.OPENAI_API_KEY,
@@ -92,6 +143,8 @@ class LangChainRAGService:
                 temperature=self.settings.TEMPERATURE,
                 max_tokens=1500,
                 streaming=False,
+                stream_usage=True,  # astream 시에도 토큰 사용량 집계
+                http_async_client=http_client,
             )
             logger.info("✅ LangChain ChatOpenAI 초기화 완료")
         elif self.settings.GEMINI_API_KEY:
@@ -115,8 +168,12 @@ class LangChainRAGService:
         self.vector_store = VectorStore()
         self.search_service = HybridSearchService(self.vector_store)
 
-        # Memory 시스템 초기화 (세션별 관리)
-        self._memories: Dict[str, ConversationBufferWindowMemory] = {}
+        # Memory 시스템 초기화 (세션별 관리, 최근 사용 순서를 유지해 상한 초과 시 LRU 제거)
+        self._memories: OrderedDict[str, CachedWindowMemory] = OrderedDict()
+
+        # 질문 분류 결과 캐시 ((정규화된 질문, 대화 기록) 해시 → 분류 결과, LRU)
+        self._classification_cache: OrderedDict[bytes, Dict[str, Any]] = OrderedDict()
+        self._classification_inflight: Dict[bytes, asyncio.Future] = {}
 
         # 시스템 프롬프트 설정
         self.classification_system_template = self._read_prompt_file("system_prompt.txt")
@@ -133,18 +190,20 @@ class LangChainRAGService:
         logger.info("✅ LangChain RAG 서비스 (Memory 통합) 초기화 완료")
 
     def _read_prompt_file(self, prompt_file_name: str):
-        file_path = os.path.join(self.settings.SECRET_PATH, prompt_file_name)
-        prompt_text = ""
-        if os.path.isfile(file_path):
-            with open(file_path, "r") as f:
-                prompt_text = f.read()
-        return prompt_text
-
-    def _get_or_create_memory(self, session_id: str) -> ConversationBufferWindowMemory:
+        return _read_prompt_file(self.settings.SECRET_PATH, prompt_file_name)
+
+    def _get_or_create_memory(self, session_id: str) -> CachedWindowMemory:
         """세션별 Memory 생성 또는 조회"""
-        if session_id not in self._memories:
+        if session_id in self._memories:
+            self._memories.move_to_end(session_id)
+        else:
+            # 세션 수 상한 초과 시 가장 오래 사용하지 않은 세션 제거
+            while self._memories and len(self._memories) >= self.settings.MAX_MEMORY_SESSIONS:
+                evicted_session_id, _ = self._memories.popitem(last=False)
+                logger.debug(f"🗑️ 오래된 Memory 제거: {evicted_session_id}")
+
             # 대화 윈도우 메모리 생성 (최근 10개 메시지만 유지)
-            self._memories[session_id] = ConversationBufferWindowMemory(
+            self._memories[session_id] = CachedWindowMemory(
                 k=10,  # 최근 10개 메시지만 기억
                 memory_key="chat_history",
                 return_messages=True,
@@ -161,7 +220,7 @@ class LangChainRAGService:
         # 1. 질문 분류 프롬프트 (대화 맥락 포함)
         self.classification_prompt = ChatPromptTemplate.from_messages(
             [
-                SystemMessagePromptTemplate.from_template(self.classification_system_template),
+                self._build_system_message(self.classification_system_template),
                 HumanMessagePromptTemplate.from_template(self.classification_human_template),
             ]
         )
@@ -169,11 +228,19 @@ class LangChainRAGService:
         # 2. 최종 답변 생성 프롬프트 (대화 맥락 포함)
         self.answer_prompt = ChatPromptTemplate.from_messages(
             [
-                SystemMessagePromptTemplate.from_template(self.answer_system_template),
+                self._build_system_message(self.answer_system_template),
                 HumanMessagePromptTemplate.from_template(self.answer_human_template),
             ]
         )
 
+    @staticmethod
+    def _build_system_message(template: str) -> Union[SystemMessage, SystemMessagePromptTemplate]:
+        """입력 변수가 없는 시스템 프롬프트는 미리 한 번 포맷한 고정 메시지로 사용 (호출마다 템플릿 처리 생략)"""
+        system_template = SystemMessagePromptTemplate.from_template(template)
+        if system_template.input_variables:
+            return system_template
+        return system_template.format()
+
     def _setup_rag_chain(self):
         """완전한 RAG 체인 구성"""
         if not self.classification_llm or not self.answer_llm:
@@ -188,9 +255,27 @@ class LangChainRAGService:
         classification_chain = self.classification_prompt | self.classification_llm | classification_parser
 
         # 2. 문서 검색 함수
-        async def retrieve_documents_async(classification_result: Dict[str, Any]) -> Dict[str, Any]:
-            """분류 결과를 바탕으로 문서 검색 (비동기)"""
+        async def retrieve_documents_async(
+            classification_result: Dict[str, Any],
+            original_query: str = "",
+            speculative_search: Optional[asyncio.Task] = None,
+        ) -> Dict[str, Any]:
+            """분류 결과를 바탕으로 문서 검색 (원 질문으로 미리 시작한 검색이 있으면 조건에 따라 재사용)"""
             try:
+                # 법률과 무관하거나 분류 신뢰도가 낮은 질문은 검색 생략
+                if (
+                    not classification_result.get("is_legal_related", False)
+                    or classification_result.get("confidence", 0.0) < MIN_CLASSIFICATION_CONFIDENCE_FOR_SEARCH
+                ):
+                    if speculative_search is not None:
+                        speculative_search.cancel()
+                    logger.info("⏭️ 법률 관련 질문이 아니므로 문서 검색 생략")
+                    return {
+                        "classification_result": classification_result,
+                        "retrieved_docs": [],
+                        "search_performed": False,
+                    }
+
                 # 검색 키워드 추출
                 search_keywords = classification_result.get("search_keywords", [])
                 main_topic = classification_result.get("main_topic", "")
@@ -198,6 +283,27 @@ class LangChainRAGService:
                 # 검색 쿼리 구성
                 search_query = " ".join(search_keywords) if search_keywords else main_topic
 
+                reuse_speculative = speculative_search is not None and self._is_speculative_search_reusable(
+                    original_query, search_keywords or main_topic.split()
+                )
+                if speculative_search is not None and not reuse_speculative:
+                    speculative_search.cancel()
+
+                if reuse_speculative:
+                    # 분류 키워드가 원 질문과 거의 같으므로 미리 수행한 검색 결과 사용
+                    search_query = original_query
+                    logger.info(f"🔍 문서 검색 (사전 검색 재사용): '{search_query}'")
+                    retrieved_docs = await speculative_search
+
+                    logger.info(f"📚 검색 결과: {len(retrieved_docs)}개 문서")
+
+                    return {
+                        "classification_result": classification_result,
+                        "retrieved_docs": retrieved_docs,
+                        "search_performed": True,
+                        "search_query": search_query,
+                    }
+
                 if not search_query.strip():
                     logger.warning("⚠️ 검색 쿼리가 비어있음")
                     return {
@@ -225,6 +331,8 @@ class LangChainRAGService:
                 }
 
             except Exception as e:
+                if speculative_search is not None:
+                    speculative_search.cancel()
                 logger.error(f"❌ 문서 검색 실패: {str(e)}")
                 return {
                     "classification_result": classification_result,
@@ -233,11 +341,6 @@ class LangChainRAGService:
                     "error": str(e),
                 }
 
-        # 동기 래퍼 함수
-        def retrieve_documents(classification_result: Dict[str, Any]) -> Dict[str, Any]:
-            """문서 검색 동기 래퍼"""
-            return asyncio.create_task(retrieve_documents_async(classification_result))
-
         # 3. 답변 생성용 데이터 포맷팅
         def format_for_answer(search_result: Dict[str, Any]) -> Dict[str, Any]:
             """답변 생성을 위한 데이터 포맷팅"""
@@ -295,33 +398,11 @@ class LangChainRAGService:
 
             # 세션별 Memory 조회/생성
             memory = self._get_or_create_memory(session_id)
-
-            # 대화 기록을 문자열로 변환
-            chat_history = ""
-            if hasattr(memory, "chat_memory") and memory.chat_memory.messages:
-                # 최근 대화 기록을 문자열로 변환
-                recent_messages = memory.chat_memory.messages[-6:]  # 최근 3턴
-                for msg in recent_messages:
-                    if hasattr(msg, "content"):
-                        role = "사용자" if msg.__class__.__name__ == "HumanMessage" else "Law Mate"
-                        chat_history += f"{role}: {msg.content}\n"
+            chat_history = memory.render_recent()
 
             # 완전한 RAG 체인 실행 (토큰 사용량 추적)
             with get_openai_callback() as cb:
-                # 1단계: 질문 분류 (대화 맥락 포함)
-                logger.debug("1️⃣ 질문 분류 중... (대화 맥락 포함)")
-                classification_input = {"query": query, "chat_history": chat_history.strip()}
-                classification_result = await self.classification_chain.ainvoke(classification_input)
-
-                # 2단계: 문서 검색
-                logger.debug("2️⃣ 문서 검색 중...")
-                search_result = await self.retrieve_documents_func(classification_result)
-                search_result["original_query"] = query
-
-                # 3단계: 답변 생성용 데이터 포맷팅
-                logger.debug("3️⃣ 데이터 포맷팅 중...")
-                formatted_data = self.format_for_answer_func(search_result)
-                formatted_data["chat_history"] = chat_history.strip()
+                formatted_data = await self._prepare_answer_input(query, chat_history)
 
                 # 4단계: 최종 답변 생성 (대화 맥락 포함)
                 logger.debug("4️⃣ 답변 생성 중... (대화 맥락 포함)")
@@ -331,58 +412,202 @@ class LangChainRAGService:
                 logger.debug("5️⃣ 대화 기록 저장 중...")
                 memory.save_context({"input": query}, {"output": answer})
 
-            # 결과 추출
-            classification = formatted_data["_classification"]
-            retrieved_docs = formatted_data["_retrieved_docs"]
-            search_performed = formatted_data["_search_performed"]
+            logger.info(f"✅ LangChain RAG 파이프라인 완료 (토큰: {cb.total_tokens}, 세션: {session_id})")
+            return self._build_query_result(answer, formatted_data, chat_history, session_id, cb)
 
-            # 신뢰도 계산
-            confidence = self._calculate_confidence(answer, retrieved_docs, classification.get("confidence", 0.0))
+        except Exception as e:
+            logger.error(f"❌ LangChain RAG 파이프라인 실패: {str(e)}")
+            return self._build_error_result(e, query, session_id, context_info)
 
-            logger.info(f"✅ LangChain RAG 파이프라인 완료 (토큰: {cb.total_tokens}, 세션: {session_id})")
+    async def process_query_stream(
+        self, query: str, session_id: str = "default", context_info: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        RAG 파이프라인으로 질문 처리 (답변 스트리밍)
+        답변 조각마다 {"type": "token", "content": ...}를 보내고,
+        마지막에 process_query와 같은 결과를 {"type": "result", ...}로 보냅니다.
+        """
+        try:
+            if not self.classification_llm and not self.answer_llm:
+                yield {"type": "result", **self._generate_fallback_response(query, context_info)}
+                return
 
-            return {
-                "answer": answer,
-                "confidence": confidence,
-                "classification": {
-                    "is_legal_related": classification.get("is_legal_related", False),
-                    "category": classification.get("legal_category"),
-                    "confidence": classification.get("confidence", 0.0),
-                    "reason": f"LangChain 분류: {classification.get('reasoning', '')}",
-                    "main_topic": classification.get("main_topic", ""),
-                    "key_entities": classification.get("key_entities", []),
-                    "is_follow_up": classification.get("is_follow_up", False),
-                },
-                "retrieved_docs": retrieved_docs,
-                "search_performed": search_performed,
-                "tokens_used": cb.total_tokens,
-                "model": self.settings.OPENAI_MODEL,
-                "cost": cb.total_cost if hasattr(cb, "total_cost") else 0.0,
-                "pipeline_type": "langchain_full_rag_with_memory",
-                "session_id": session_id,
-                "has_context": len(chat_history) > 0,
-            }
+            logger.info(f"🚀 LangChain RAG 스트리밍 파이프라인 시작: '{query[:50]}...' (세션: {session_id})")
+
+            # 세션별 Memory 조회/생성
+            memory = self._get_or_create_memory(session_id)
+            chat_history = memory.render_recent()
+
+            # 완전한 RAG 체인 실행 (토큰 사용량 추적)
+            with get_openai_callback() as cb:
+                formatted_data = await self._prepare_answer_input(query, chat_history)
+
+                # 4단계: 최종 답변을 생성되는 대로 전달 (대화 맥락 포함)
+                logger.debug("4️⃣ 답변 스트리밍 중... (대화 맥락 포함)")
+                answer_parts = []
+                async for chunk in self.answer_chain.astream(formatted_data):
+                    answer_parts.append(chunk)
+                    yield {"type": "token", "content": chunk}
+                answer = "".join(answer_parts)
+
+                # 5단계: Memory에 대화 저장
+                logger.debug("5️⃣ 대화 기록 저장 중...")
+                memory.save_context({"input": query}, {"output": answer})
+
+            logger.info(f"✅ LangChain RAG 스트리밍 파이프라인 완료 (토큰: {cb.total_tokens}, 세션: {session_id})")
+            yield {"type": "result", **self._build_query_result(answer, formatted_data, chat_history, session_id, cb)}
 
         except Exception as e:
-            logger.error(f"❌ LangChain RAG 파이프라인 실패: {str(e)}")
+            logger.error(f"❌ LangChain RAG 스트리밍 파이프라인 실패: {str(e)}")
+            yield {"type": "result", **self._build_error_result(e, query, session_id, context_info)}
+
+    async def _prepare_answer_input(self, query: str, chat_history: str) -> Dict[str, Any]:
+        """질문 분류 → 문서 검색 → 답변 생성 입력 구성 (1~3단계)"""
+        # 법률 키워드가 있는 질문만 원 질문으로 문서 검색을 미리 시작해 분류와 동시에 진행
+        # (검색은 스레드에서 실행되어 시작 후에는 취소해도 중단되지 않으므로, 생략될 가능성이 큰 질문은 미리 검색하지 않음)
+        speculative_search = None
+        if self._has_legal_keyword(query):
+            speculative_search = asyncio.create_task(
+                self.search_service.search(
+                    query=query,
+                    top_k=self.settings.TOP_K_DOCUMENTS,
+                    similarity_threshold=self.settings.SIMILARITY_THRESHOLD,
+                )
+            )
+
+        # 1단계: 질문 분류 (대화 맥락 포함)
+        logger.debug("1️⃣ 질문 분류 중... (대화 맥락 포함)")
+        try:
+            classification_result = await self._classify_query(query, chat_history)
+        except BaseException:
+            if speculative_search is not None:
+                speculative_search.cancel()
+            raise
+
+        # 2단계: 문서 검색
+        logger.debug("2️⃣ 문서 검색 중...")
+        search_result = await self.retrieve_documents_func(classification_result, query, speculative_search)
+        search_result["original_query"] = query
+
+        # 3단계: 답변 생성용 데이터 포맷팅
+        logger.debug("3️⃣ 데이터 포맷팅 중...")
+        formatted_data = self.format_for_answer_func(search_result)
+        formatted_data["chat_history"] = chat_history
+        return formatted_data
+
+    def _build_query_result(
+        self, answer: str, formatted_data: Dict[str, Any], chat_history: str, session_id: str, cb: Any
+    ) -> Dict[str, Any]:
+        """답변과 중간 결과로 최종 응답 구성"""
+        # 결과 추출
+        classification = formatted_data["_classification"]
+        retrieved_docs = formatted_data["_retrieved_docs"]
+        search_performed = formatted_data["_search_performed"]
 
-            # API 키 오류인 경우 더 나은 폴백 제공
-            if "401" in str(e) or "api_key" in str(e).lower():
-                return self._generate_enhanced_fallback_response(query, session_id, context_info)
+        # 신뢰도 계산
+        confidence = self._calculate_confidence(answer, retrieved_docs, classification.get("confidence", 0.0))
 
-            return {
-                "answer": f"죄송합니다. 답변 생성 중 오류가 발생했습니다: {str(e)}",
+        return {
+            "answer": answer,
+            "confidence": confidence,
+            "classification": {
+                "is_legal_related": classification.get("is_legal_related", False),
+                "category": classification.get("legal_category"),
+                "confidence": classification.get("confidence", 0.0),
+                "reason": f"LangChain 분류: {classification.get('reasoning', '')}",
+                "main_topic": classification.get("main_topic", ""),
+                "key_entities": classification.get("key_entities", []),
+                "is_follow_up": classification.get("is_follow_up", False),
+            },
+            "retrieved_docs": retrieved_docs,
+            "search_performed": search_performed,
+            "tokens_used": cb.total_tokens,
+            "model": self.settings.OPENAI_MODEL,
+            "cost": cb.total_cost if hasattr(cb, "total_cost") else 0.0,
+            "pipeline_type": "langchain_full_rag_with_memory",
+            "session_id": session_id,
+            "has_context": len(chat_history) > 0,
+        }
+
+    def _build_error_result(
+        self, error: Exception, query: str, session_id: str, context_info: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """파이프라인 오류 응답 구성"""
+        # API 키 오류인 경우 더 나은 폴백 제공
+        if "401" in str(error) or "api_key" in str(error).lower():
+            return self._generate_enhanced_fallback_response(query, session_id, context_info)
+
+        return {
+            "answer": f"죄송합니다. 답변 생성 중 오류가 발생했습니다: {str(error)}",
+            "confidence": 0.0,
+            "classification": {
+                "is_legal_related": False,
+                "category": None,
                 "confidence": 0.0,
-                "classification": {
-                    "is_legal_related": False,
-                    "category": None,
-                    "confidence": 0.0,
-                    "reason": f"파이프라인 오류: {str(e)}",
-                },
-                "error": str(e),
-                "pipeline_type": "langchain_full_rag_with_memory",
-                "session_id": session_id,
-            }
+                "reason": f"파이프라인 오류: {str(error)}",
+            },
+            "error": str(error),
+            "pipeline_type": "langchain_full_rag_with_memory",
+            "session_id": session_id,
+        }
+
+    @staticmethod
+    def _classification_cache_key(query: str, chat_history: str) -> bytes:
+        """분류 캐시 키 (대소문자/공백을 정규화한 질문과 대화 기록의 해시)"""
+        normalized_query = " ".join(query.lower().split())
+        return hashlib.blake2b(f"{normalized_query}|{chat_history}".encode("utf-8"), digest_size=16).digest()
+
+    async def _classify_query(self, query: str, chat_history: str) -> Dict[str, Any]:
+        """질문 분류 (같은 질문과 대화 맥락이면 캐시된 결과 사용)"""
+        cache_key = self._classification_cache_key(query, chat_history)
+        cached = self._classification_cache.get(cache_key)
+        if cached is not None:
+            self._classification_cache.move_to_end(cache_key)
+            logger.debug("✅ 질문 분류 캐시 사용")
+            return cached
+
+        # 같은 분류 요청이 이미 진행 중이면 LLM을 다시 호출하지 않고 그 결과를 함께 사용
+        inflight = self._classification_inflight.get(cache_key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._run_classification(cache_key, query, chat_history))
+            self._classification_inflight[cache_key] = inflight
+            inflight.add_done_callback(lambda _: self._classification_inflight.pop(cache_key, None))
+        else:
+            logger.debug("🔗 진행 중인 질문 분류 결과 공유")
+
+        # 한 요청이 취소되어도 같은 분류를 기다리는 다른 요청에는 영향이 없도록 보호
+        return await asyncio.shield(inflight)
+
+    async def _run_classification(self, cache_key: bytes, query: str, chat_history: str) -> Dict[str, Any]:
+        """분류 체인 호출 후 결과를 캐시에 저장"""
+        classification_input = {"query": query, "chat_history": chat_history}
+        classification_result = await self.classification_chain.ainvoke(classification_input)
+
+        # 파싱 실패 기본값은 캐시하지 않음
+        if classification_result.get("reasoning") != CLASSIFICATION_PARSE_FAILURE_REASON:
+            self._classification_cache[cache_key] = classification_result
+            if len(self._classification_cache) > CLASSIFICATION_CACHE_SIZE:
+                self._classification_cache.popitem(last=False)
+
+        return classification_result
+
+    @staticmethod
+    def _has_legal_keyword(query: str) -> bool:
+        """질문에 법률 분야 키워드가 하나라도 있는지 확인 (분류 전 사전 검색 여부 판단용)"""
+        query_lower = query.lower()
+        if any(keyword in query_lower for keyword in LEGAL_KEYWORDS):
+            return True
+        return any(keyword in query_lower for keywords in CATEGORY_KEYWORDS.values() for keyword in keywords)
+
+    @staticmethod
+    def _is_speculative_search_reusable(original_query: str, search_keywords: List[str]) -> bool:
+        """분류 키워드 대부분이 원 질문에 그대로 들어 있어 원 질문 검색 결과로 대체할 수 있는지 판단"""
+        keywords = [keyword for keyword in search_keywords if keyword.strip()]
+        if not keywords:
+            return False
+
+        contained = sum(1 for keyword in keywords if keyword in original_query)
+        return contained / len(keywords) >= SPECULATIVE_SEARCH_REUSE_RATIO
 
     def _calculate_confidence(
         self, answer: str, retrieved_docs: List[Dict[str, Any]], classification_confidence: float
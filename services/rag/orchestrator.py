@@ -5,7 +5,9 @@ RAG 시스템의 컴포넌트들을 조율하는 중앙 서비스입니다.
 """
 
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional
+
+import httpx
 
 from core.config import get_settings
 from core.logging.config import get_logger
@@ -31,8 +33,13 @@ class RAGOrchestrator:
     완전한 LangChain 파이프라인을 통해 질문 분류부터 답변 생성까지 처리합니다.
     """
 
-    def __init__(self):
-        """RAG 오케스트레이터 초기화"""
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        RAG 오케스트레이터 초기화
+
+        Args:
+            http_client: 외부 API 호출에 재사용할 공유 비동기 HTTP 클라이언트
+        """
         try:
             logger.info("🚀 RAG 오케스트레이터 초기화 중...")
 
@@ -41,7 +48,7 @@ class RAGOrchestrator:
             # 핵심 서비스 컴포넌트 초기화
             self.vector_store = VectorStore()
             self.document_processor = DocumentProcessor()
-            self.langchain_rag_service = LangChainRAGService()
+            self.langchain_rag_service = LangChainRAGService(http_client=http_client)
             self.search_service = HybridSearchService(self.vector_store)
 
             # 분리된 RAG 서비스들 초기화
@@ -137,6 +144,56 @@ class RAGOrchestrator:
 
             return self.response_formatter.create_error_response(error_msg, "QUERY_PROCESSING_ERROR", processing_time)
 
+    async def process_query_stream(
+        self, user_query: str, user_id: Optional[str] = None, session_id: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        사용자 질문 처리 (답변 스트리밍)
+        답변 조각({"type": "token"})을 생성되는 대로 전달하고,
+        마지막 결과({"type": "result"})에는 process_query와 같은 세션 및 성능 정보를 추가합니다.
+        """
+        start_time = time.time()
+
+        try:
+            logger.info(f"🚀 LangChain 스트리밍 파이프라인 질문 처리: '{user_query}' (세션: {session_id})")
+
+            # 세션 ID가 없으면 자동 생성 (UUID 기반)
+            if not session_id:
+                import uuid
+
+                session_id = str(uuid.uuid4())
+                logger.debug(f"🆕 새 세션 ID 생성: {session_id}")
+
+            async for event in self.langchain_rag_service.process_query_stream(query=user_query, session_id=session_id):
+                if event["type"] != "result":
+                    yield event
+                    continue
+
+                processing_time = time.time() - start_time
+                logger.info(f"✅ LangChain 스트리밍 파이프라인 처리 완료 ({processing_time:.2f}초)")
+
+                # 성능 메트릭 기록
+                self.system_monitor.record_query_performance(processing_time, success=True)
+
+                # 최종 응답에 세션 및 성능 정보 추가
+                event["session_id"] = session_id
+                event["processing_time"] = processing_time
+                event["pipeline_type"] = "langchain_full_rag"
+                yield event
+
+        except Exception as e:
+            processing_time = time.time() - start_time
+            error_msg = f"질문 처리 오류: {str(e)}"
+            logger.error(f"❌ {error_msg}")
+
+            self.system_monitor.record_error(error_msg, "query_processing")
+            self.system_monitor.record_query_performance(processing_time, success=False)
+
+            yield {
+                "type": "result",
+                **self.response_formatter.create_error_response(error_msg, "QUERY_PROCESSING_ERROR", processing_time),
+            }
+
     async def get_conversation_history(self, session_id: str) -> Dict[str, Any]:
         """대화 기록 조회 (LangChain Memory에서)"""
         try:
@@ -166,33 +223,31 @@ class RAGOrchestrator:
         try:
             logger.info(f"📄 문서 처리 시작: {data_path}")
 
-            # 문서 처리
-            processed_docs = await self.document_processor.process_documents(data_path)
+            # 문서 청크를 배치 단위로 받아 바로 벡터 스토어에 추가
+            processed_count = 0
+            async for batch in self.document_processor.iter_chunks(data_path):
+                if not await self.vector_store.add_documents(batch):
+                    return {"success": False, "message": "문서 저장에 실패했습니다.", "processed_count": processed_count}
+                processed_count += len(batch)
 
-            if not processed_docs:
+            if not processed_count:
                 return {"success": False, "message": "처리할 문서가 없습니다.", "processed_count": 0}
 
-            # 벡터 스토어에 추가
-            success = await self.vector_store.add_documents(processed_docs)
-
-            if success:
-                # 검색 인덱스 재구축
-                await self.search_service.rebuild_index()
+            # 검색 인덱스 재구축
+            await self.search_service.rebuild_index()
 
-                # 시스템 상태 업데이트
-                document_count = self.vector_store.get_document_count()
-                self.system_monitor.update_initialization_status(
-                    is_initialized=True, documents_loaded=document_count, search_index_built=True
-                )
+            # 시스템 상태 업데이트
+            document_count = self.vector_store.get_document_count()
+            self.system_monitor.update_initialization_status(
+                is_initialized=True, documents_loaded=document_count, search_index_built=True
+            )
 
-                logger.info(f"✅ 문서 처리 완료: {len(processed_docs)}개")
-                return {
-                    "success": True,
-                    "message": f"{len(processed_docs)}개 문서가 성공적으로 처리되었습니다.",
-                    "processed_count": len(processed_docs),
-                }
-            else:
-                return {"success": False, "message": "문서 저장에 실패했습니다.", "processed_count": 0}
+            logger.info(f"✅ 문서 처리 완료: {processed_count}개")
+            return {
+                "success": True,
+                "message": f"{processed_count}개 문서가 성공적으로 처리되었습니다.",
+                "processed_count": processed_count,
+            }
 
         except Exception as e:
             error_msg = f"문서 처리 오류: {str(e)}"
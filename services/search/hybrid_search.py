@@ -398,7 +398,9 @@ class HybridSearchService:
 
             # VectorStore에서 모든 문서 조회
             logger.debug("📄 VectorStore에서 모든 문서 조회 중...")
-            all_documents = await self.vector_store.get_all_documents()
+            all_documents = []
+            async for batch in self.vector_store.iter_all_documents():
+                all_documents.extend(batch)
 
             if not all_documents:
                 logger.warning("⚠️ 재구축할 문서가 없습니다")